@@ -2,8 +2,10 @@
 # main.py
 from fastapi import FastAPI, HTTPException, Request, Header, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Optional, Dict, Any, List
+from collections import Counter
 import uvicorn
 import json
 import random
@@ -19,6 +21,7 @@ from services.database_service import db_service
 from services.cross_provider_intelligence import cross_provider_intelligence
 from services.compliance_native_monitoring import compliance_monitor, ComplianceFramework
 from services.multi_agent_manager import multi_agent_manager, AgentType, RoutingStrategy
+from services.ai_traffic_proxy import ai_traffic_proxy
 from proxy.ai_providers import PROVIDERS
 
 # Import authentication modules
@@ -56,6 +59,12 @@ app.include_router(gateway_router)
 app.include_router(pii_router)
 app.include_router(hallucination_router)
 
+@app.on_event("shutdown")
+async def shutdown():
+    """Flush queued logs and release pooled connections"""
+    await ai_traffic_proxy.aclose()
+    await db_service.aclose()
+
 # Enable CORS for frontend
 app.add_middleware(
     CORSMiddleware,
@@ -1124,17 +1133,17 @@ async def get_compliance_status(
                 "message": "No compliance assessments available"
             }
         
-        # Calculate overall compliance rate
+        # Calculate overall compliance rate and violation summary in one pass
         total_assessments = len(recent_assessments)
-        compliant_assessments = len([a for a in recent_assessments if a['overall_compliance']])
-        compliance_rate = compliant_assessments / total_assessments
-        
-        # Get violation summary
-        violation_counts = {}
+        compliant_assessments = 0
+        violation_counts = Counter()
         for assessment in recent_assessments:
-            for violation in assessment['violations']:
-                framework = violation.get('framework', 'unknown')
-                violation_counts[framework] = violation_counts.get(framework, 0) + 1
+            if assessment['overall_compliance']:
+                compliant_assessments += 1
+            violation_counts.update(
+                violation.get('framework', 'unknown') for violation in assessment['violations']
+            )
+        compliance_rate = compliant_assessments / total_assessments
         
         return {
             "success": True,
@@ -1142,7 +1151,7 @@ async def get_compliance_status(
                 "compliance_rate": compliance_rate,
                 "total_assessments": total_assessments,
                 "compliant_assessments": compliant_assessments,
-                "violation_counts": violation_counts,
+                "violation_counts": dict(violation_counts),
                 "last_assessment": recent_assessments[-1]['timestamp'] if recent_assessments else None
             },
             "generated_at": datetime.now().isoformat()
@@ -1171,7 +1180,7 @@ async def intelligence_websocket(
             "type": "intelligence_summary",
             "data": {
                 "provider_status": cross_provider_intelligence.provider_status,
-                "recent_threats": len(ai_security_scanner._load_prompt_injection_patterns()),
+                "recent_threats": len(ai_security_scanner.prompt_injection_patterns),
                 "compliance_frameworks": len(compliance_framework.frameworks),
                 "monitoring_active": True
             },
@@ -1663,7 +1672,8 @@ async def generate_compliance_report(
             team_id=team_id
         )
         
-        return report
+        # The report is plain JSON data; orjson encodes it directly, skipping jsonable_encoder
+        return ORJSONResponse(report)
         
     except HTTPException:
         raise
@@ -1715,21 +1725,11 @@ async def assess_all_frameworks(
         ai_system_data = await request.json()
         
         # Assess all frameworks
-        assessment_results = {}
-        for framework in ComplianceFramework:
-            try:
-                result = await compliance_monitor.assess_compliance(
-                    framework=framework,
-                    ai_system_data=ai_system_data,
-                    user_id=user_id,
-                    team_id=team_id
-                )
-                assessment_results[framework.value] = result
-            except Exception as e:
-                assessment_results[framework.value] = {
-                    "error": str(e),
-                    "status": "failed"
-                }
+        assessment_results = await compliance_monitor.assess_all(
+            ai_system_data=ai_system_data,
+            user_id=user_id,
+            team_id=team_id
+        )
         
         # Calculate overall compliance score
         successful_assessments = [r for r in assessment_results.values() if "compliance_score" in r]
@@ -2,15 +2,62 @@
 import re
 import json
 import asyncio
-from typing import Dict, Any, List, Optional
+import time
+from typing import Dict, Any, List, Optional, Tuple
+from collections import OrderedDict
 from datetime import datetime
+from dataclasses import dataclass, field, asdict
 import hashlib
+import logging
+import numpy as np
 from services.faithfulness_evaluator import FaithfulnessEvaluator
+from utils.timestamps import utc_isoformat
+
+try:
+    from services.advanced_hallucination_detector import advanced_hallucination_detector
+except ImportError:
+    advanced_hallucination_detector = None
+
+logger = logging.getLogger(__name__)
+
+@dataclass(slots=True)
+class SecurityAnalysis:
+    """Security analysis of a request/response pair"""
+    prompt_injection_detected: bool = False
+    data_extraction_attempt: bool = False
+    malicious_request: bool = False
+    security_score: float = 1.0  # 1.0 = secure, 0.0 = high risk
+    detected_patterns: List[str] = field(default_factory=list)
+    risk_indicators: List[str] = field(default_factory=list)
 
 class AIQualityAnalyzer:
+    # Responses are only scanned up to these lengths; quality heuristics gain
+    # little signal past the first 16KB, while contradictions may be far apart
+    MAX_SCAN_CHARS = 16384
+    MAX_CONSISTENCY_SCAN_CHARS = 32768
+    
+    # Overall quality weights, in feature order: (1 - hallucination), confidence,
+    # factual consistency, security, (1 - bias), (1 - toxicity)
+    QUALITY_WEIGHTS = (0.3, 0.2, 0.2, 0.15, 0.1, 0.05)
+    
+    # Response-only scores remembered per response digest
+    RESPONSE_SCORE_CACHE_SIZE = 4096
+    
+    # Resolved once at import time instead of on every analyze_quality call
+    ADVANCED_DETECTOR_AVAILABLE = advanced_hallucination_detector is not None
+    
+    __slots__ = (
+        'hallucination_indicators', 'confidence_indicators', 'misinformation_patterns',
+        'overconfidence_patterns', 'toxic_indicators', 'specific_claim_pattern',
+        'citation_pattern', 'impossible_patterns', 'biased_language_patterns',
+        'compliance_indicator_pattern', 'indicator_phrases', 'contradictory_pairs',
+        'contradiction_pattern', 'contradiction_implied_terms', 'security_patterns', 'security_category_patterns',
+        'faithfulness_evaluator', '_response_score_cache', '_overall',
+    )
+
     def __init__(self):
         # Patterns that often indicate hallucination
-        self.hallucination_indicators = [
+        self.hallucination_indicators = (
             r"I don't have access to real-time",
             r"I cannot browse the internet",
             r"As of my last update",
@@ -19,30 +66,98 @@ class AIQualityAnalyzer:
             r"I'm not sure about",
             r"I don't have specific data",
             r"I cannot confirm",
-        ]
+        )
         
         # Patterns indicating high confidence/factual responses
-        self.confidence_indicators = [
+        self.confidence_indicators = (
             r"According to",
             r"Based on",
             r"The data shows",
             r"Studies indicate",
             r"Research demonstrates",
             r"Official sources state",
-        ]
+        )
         
         # Red flag patterns for potential misinformation
-        self.misinformation_patterns = [
+        self.misinformation_patterns = (
             r"definitely causes cancer",
             r"guaranteed to",
             r"100% effective",
             r"scientifically proven to",
             r"all experts agree",
             r"no side effects",
-        ]
+        )
+        
+        # Overconfidence in unprovable claims
+        self.overconfidence_patterns = (
+            r"definitely",
+            r"certainly",
+            r"absolutely",
+            r"without a doubt",
+            r"guaranteed",
+        )
+        
+        # Simple toxic language indicators
+        self.toxic_indicators = (
+            r"hate",
+            r"violence",
+            r"harm",
+            r"kill",
+            r"destroy",
+            r"attack",
+            r"stupid",
+            r"idiot",
+        )
+        
+        # Regex heuristics, compiled once
+        self.specific_claim_pattern = re.compile(r"(\d+%|\d+\.\d+|\$\d+|in \d{4}|on [A-Z][a-z]+ \d+)")
+        self.citation_pattern = re.compile(r"(according to|source:|via|from [A-Z][a-z]+)", re.IGNORECASE)
+        self.impossible_patterns = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+            r"before 1900.*invented in 2023",
+            r"100% of people",
+            r"never happens.*always occurs",
+        ])
+        self.biased_language_patterns = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+            r"all (men|women|people) are",
+            r"(men|women) should always",
+            r"it's natural for (men|women) to",
+            r"(race|ethnicity|religion) tends to",
+            r"people from .* are typically",
+        ])
+        # Only presence matters for compliance, so one alternation suffices
+        self.compliance_indicator_pattern = re.compile(
+            r"here's how to|step by step|instructions:|tutorial:", re.IGNORECASE
+        )
+        
+        # Every literal indicator phrase, tagged by category. The counts for all
+        # categories are computed once per response and shared by the helpers
+        self.indicator_phrases = {
+            "uncertainty": tuple(p.lower() for p in self.hallucination_indicators),
+            "confidence": tuple(p.lower() for p in self.confidence_indicators),
+            "misinformation": tuple(p.lower() for p in self.misinformation_patterns),
+            "overconfidence": self.overconfidence_patterns,
+            "toxic": self.toxic_indicators,
+            "hedging": ("might", "could", "possibly", "potentially", "appears", "seems"),
+            "loaded": ("obviously", "naturally", "of course", "clearly", "everyone knows"),
+        }
+        
+        # Contradictory statement pairs, matched in one pass by a named-group union
+        self.contradictory_pairs = (
+            ("is_safe", "is_dangerous"),
+            ("always", "never"),
+            ("increases", "decreases"),
+            ("effective", "ineffective"),
+        )
+        self.contradiction_pattern = re.compile(
+            r"(?P<is_safe>is safe)|(?P<is_dangerous>is dangerous)|(?P<always>always)|(?P<never>never)|"
+            r"(?P<increases>increases)|(?P<decreases>decreases)|(?P<ineffective>ineffective)|(?P<effective>effective)",
+            re.IGNORECASE
+        )
+        # Terms found inside a longer matched term, as a substring search for them would find them
+        self.contradiction_implied_terms = {"ineffective": "effective"}
         
         # Security vulnerability patterns
-        self.security_patterns = {
+        raw_security_patterns = {
             "prompt_injection": [
                 r"ignore previous instructions",
                 r"forget your role",
@@ -67,21 +182,45 @@ class AIQualityAnalyzer:
                 r"bypass security",
             ]
         }
+        # Compiled once; the source string is kept for reporting detected patterns
+        self.security_patterns = {
+            category: tuple((re.compile(pattern, re.IGNORECASE), pattern) for pattern in patterns)
+            for category, patterns in raw_security_patterns.items()
+        }
+        # One alternation per category answers "did anything match?" in a single search
+        self.security_category_patterns = {
+            category: re.compile("|".join(patterns), re.IGNORECASE)
+            for category, patterns in raw_security_patterns.items()
+        }
         
         # Initialize Faithfulness Evaluator
         self.faithfulness_evaluator = FaithfulnessEvaluator()
+        
+        # Response-only scores are pure functions of the text, so replayed
+        # responses (prompt caches, retries, benchmarks) skip the regex passes.
+        # Keyed by digest so the cache never keeps response text alive.
+        self._response_score_cache: OrderedDict[bytes, Tuple[float, ...]] = OrderedDict()
+        
+        self._overall = self._compile_overall_quality(self.QUALITY_WEIGHTS)
 
     async def analyze_quality(self, request_content: str, response_content: str,
                               model: str, provider: str, use_advanced: bool = True, context: Optional[str] = None) -> Dict[str, Any]:
         """Comprehensive AI response quality analysis"""
         
-        analysis_start = datetime.utcnow()
+        timestamp = utc_isoformat(time.time())
+        start_ns = time.perf_counter_ns()
+        
+        # Run the pattern-based detectors once; every later consumer reuses these scores
+        (hallucination_score, confidence_score, factual_consistency,
+         bias_detection, toxicity_score) = self._response_scores(
+            response_content[:self.MAX_CONSISTENCY_SCAN_CHARS]
+        )
+        hallucination_risk = self._hallucination_risk_from_score(hallucination_score)
+        advanced_details = None
         
         # Use advanced hallucination detection if available
-        if use_advanced:
+        if use_advanced and self.ADVANCED_DETECTOR_AVAILABLE:
             try:
-                from services.advanced_hallucination_detector import advanced_hallucination_detector
-                
                 advanced_analysis = await advanced_hallucination_detector.detect_hallucinations(
                     response_content=response_content,
                     request_content=request_content,
@@ -90,13 +229,12 @@ class AIQualityAnalyzer:
                 )
                 
                 # Use advanced analysis results
-                quality_score = advanced_analysis['quality_score']
                 hallucination_risk = advanced_analysis['hallucination_risk']
                 confidence_score = advanced_analysis['confidence']
-                has_hallucination = hallucination_risk in ['high', 'medium']
                 
                 # Add advanced analysis details
-                analysis['advanced_analysis'] = {
+                advanced_details = {
+                    'quality_score': advanced_analysis['quality_score'],
                     'total_claims': advanced_analysis['total_claims'],
                     'validated_claims': advanced_analysis['validated_claims'],
                     'failed_validations': advanced_analysis['failed_validations'],
@@ -105,25 +243,18 @@ class AIQualityAnalyzer:
                     'alerts': advanced_analysis['alerts']
                 }
             except Exception as e:
-                print(f"Advanced hallucination detection failed, using basic: {e}")
-                # Fallback to basic analysis
-                quality_score = self._calculate_quality_score(response_content, request_content)
-                confidence_score = self._calculate_confidence_score(response_content)
-                hallucination_risk = self._detect_hallucination_risk(response_content)
-                has_hallucination = hallucination_risk in ['high', 'medium']
-        else:
-            # Basic analysis
-            quality_score = self._calculate_quality_score(response_content, request_content)
-            confidence_score = self._calculate_confidence_score(response_content)
-            hallucination_risk = self._detect_hallucination_risk(response_content)
-            has_hallucination = hallucination_risk in ['high', 'medium']
+                # The detector is optional; any failure falls back to the pattern-based scores
+                logger.warning(f"Advanced hallucination detection failed, using basic: {e}")
+        
+        has_hallucination = hallucination_risk in ['high', 'medium']
         
-        security_analysis = self._analyze_security_risks(request_content, response_content)
-        bias_detection = self._detect_potential_bias(response_content)
-        toxicity_score = self._calculate_toxicity_score(response_content)
+        security_analysis = self._analyze_security_risks(
+            request_content, response_content[:self.MAX_SCAN_CHARS]
+        )
         
         # Faithfulness Analysis (if context is provided)
         faithfulness_result = {}
+        unfaithful = False
         if context:
             try:
                 faithfulness_result = await self.faithfulness_evaluator.evaluate(
@@ -131,34 +262,36 @@ class AIQualityAnalyzer:
                     context=context,
                     answer=response_content
                 )
-                # Adjust quality score based on faithfulness
                 if not faithfulness_result.get("is_faithful", True):
-                    quality_score = quality_score * 0.5  # Penalize for unfaithfulness
+                    unfaithful = True
                     hallucination_score = max(hallucination_score, 0.8) # High hallucination risk
                     has_hallucination = True
             except Exception as e:
-                print(f"Faithfulness evaluation failed: {e}")
+                logger.warning(f"Faithfulness evaluation failed: {e}")
 
         # Calculate overall quality score
         overall_quality = self._calculate_overall_quality(
-            quality_score, confidence_score, has_hallucination, 
-            hallucination_score, confidence_score, factual_consistency, 
+            hallucination_score, confidence_score, factual_consistency,
             security_analysis, bias_detection, toxicity_score
         )
+        if unfaithful:
+            overall_quality = overall_quality * 0.5  # Penalize for unfaithfulness
         
         # Determine risk level
         risk_level = self._determine_risk_level(overall_quality, security_analysis)
         
-        analysis_duration = (datetime.utcnow() - analysis_start).total_seconds()
+        analysis_duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
         
         return {
-            "analysis_id": self._generate_analysis_id(request_content, response_content),
-            "timestamp": analysis_start.isoformat(),
+            "analysis_id": self._generate_analysis_id(request_content, response_content, timestamp),
+            "timestamp": timestamp,
             "model": model,
             "provider": provider,
             "overall_quality_score": round(overall_quality, 2),
             "risk_level": risk_level,
-            "analysis_duration_ms": round(analysis_duration * 1000, 2),
+            "analysis_duration_ms": round(analysis_duration_ms, 2),
+            "has_hallucination": has_hallucination,
+            "response_truncated_for_analysis": len(response_content) > self.MAX_SCAN_CHARS,
             "detailed_scores": {
                 "hallucination_risk": round(hallucination_score, 2),
                 "confidence_score": round(confidence_score, 2),
@@ -167,81 +300,154 @@ class AIQualityAnalyzer:
                 "bias_score": round(bias_detection, 2),
                 "faithfulness_score": faithfulness_result.get("score", 1.0) if context else None
             },
-            "security_analysis": security_analysis,
+            "security_analysis": asdict(security_analysis),
             "faithfulness_analysis": faithfulness_result if context else None,
+            "advanced_analysis": advanced_details,
             "recommendations": self._generate_recommendations(overall_quality, security_analysis),
             "alerts": self._generate_alerts(overall_quality, security_analysis, hallucination_score)
         }
 
-    def _detect_hallucination(self, response: str, request: str) -> float:
+    def analyze_batch(self, pairs: List[Tuple[str, str]], model: str, provider: str) -> List[Dict[str, Any]]:
+        """Pattern-based quality analysis for a batch of (request, response) pairs
+        
+        Intended for replaying logged traffic: advanced hallucination detection and
+        faithfulness evaluation are skipped, and overall scores for the whole batch
+        are computed with a single feature-matrix/weight-vector product.
+        """
+        
+        if not pairs:
+            return []
+        
+        timestamp = utc_isoformat(time.time())
+        features = np.empty((len(pairs), len(self.QUALITY_WEIGHTS)))
+        rows = []
+        
+        for i, (request_content, response_content) in enumerate(pairs):
+            scores = self._response_scores(response_content[:self.MAX_CONSISTENCY_SCAN_CHARS])
+            security_analysis = self._analyze_security_risks(
+                request_content, response_content[:self.MAX_SCAN_CHARS]
+            )
+            hallucination_score, confidence_score, factual_consistency, bias_score, toxicity_score = scores
+            features[i] = (
+                1.0 - hallucination_score, confidence_score, factual_consistency,
+                security_analysis.security_score, 1.0 - bias_score, 1.0 - toxicity_score
+            )
+            rows.append((request_content, response_content, scores, security_analysis))
+        
+        overall_scores = np.clip(features @ np.asarray(self.QUALITY_WEIGHTS), 0.0, 1.0).tolist()
+        
+        results = []
+        for (request_content, response_content, scores, security_analysis), overall_quality in zip(rows, overall_scores):
+            hallucination_score, confidence_score, factual_consistency, bias_score, toxicity_score = scores
+            results.append({
+                "analysis_id": self._generate_analysis_id(request_content, response_content, timestamp),
+                "timestamp": timestamp,
+                "model": model,
+                "provider": provider,
+                "overall_quality_score": round(overall_quality, 2),
+                "risk_level": self._determine_risk_level(overall_quality, security_analysis),
+                "has_hallucination": self._hallucination_risk_from_score(hallucination_score) in ['high', 'medium'],
+                "response_truncated_for_analysis": len(response_content) > self.MAX_SCAN_CHARS,
+                "detailed_scores": {
+                    "hallucination_risk": round(hallucination_score, 2),
+                    "confidence_score": round(confidence_score, 2),
+                    "factual_consistency": round(factual_consistency, 2),
+                    "toxicity_score": round(toxicity_score, 2),
+                    "bias_score": round(bias_score, 2),
+                },
+                "security_analysis": asdict(security_analysis),
+                "recommendations": self._generate_recommendations(overall_quality, security_analysis),
+                "alerts": self._generate_alerts(overall_quality, security_analysis, hallucination_score)
+            })
+        
+        return results
+
+    def _response_scores(self, response: str) -> Tuple[float, float, float, float, float]:
+        """Response-only scores, served from the digest-keyed LRU cache when the text was seen before"""
+        key = hashlib.blake2b(response.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        cache = self._response_score_cache
+        scores = cache.get(key)
+        if scores is None:
+            scores = self._compute_response_scores(response)
+            cache[key] = scores
+            if len(cache) > self.RESPONSE_SCORE_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return scores
+
+    def _compute_response_scores(self, response: str) -> Tuple[float, float, float, float, float]:
+        """Compute every score that depends only on the response text"""
+        
+        scan_text = response[:self.MAX_SCAN_CHARS]
+        scan_text_lower = scan_text.lower()
+        counts = self._count_indicators(scan_text_lower)
+        
+        return (
+            self._detect_hallucination(scan_text, scan_text_lower, counts),
+            self._calculate_confidence_score(scan_text, counts),
+            self._check_factual_consistency(response),
+            self._detect_potential_bias(scan_text, counts),
+            self._calculate_toxicity_score(counts),
+        )
+
+    def _count_indicators(self, text_lower: str) -> Dict[str, int]:
+        """Count how many distinct phrases of each indicator category occur in the text"""
+        
+        return {
+            category: sum(phrase in text_lower for phrase in phrases)
+            for category, phrases in self.indicator_phrases.items()
+        }
+
+    def _detect_hallucination(self, response: str, response_lower: str, counts: Dict[str, int]) -> float:
         """Detect potential hallucination in AI response"""
         
         hallucination_score = 0.0
-        total_checks = 0
         
         # Check for uncertainty indicators (good - reduces hallucination risk)
-        uncertainty_matches = 0
-        for pattern in self.hallucination_indicators:
-            if re.search(pattern, response, re.IGNORECASE):
-                uncertainty_matches += 1
-        
-        if uncertainty_matches > 0:
+        if counts["uncertainty"] > 0:
             hallucination_score -= 0.3  # Lower risk if AI expresses uncertainty
         
         # Check for overconfidence in unprovable claims (bad - increases hallucination risk)
-        overconfidence_patterns = [
-            r"definitely",
-            r"certainly",
-            r"absolutely",
-            r"without a doubt",
-            r"guaranteed",
-        ]
-        
-        overconfidence_matches = sum(1 for pattern in overconfidence_patterns 
-                                   if re.search(pattern, response, re.IGNORECASE))
-        
-        if overconfidence_matches > 2:
+        if counts["overconfidence"] > 2:
             hallucination_score += 0.4
         
         # Check for specific facts without sources (medium risk)
-        specific_claims_without_sources = re.findall(
-            r"(\d+%|\d+\.\d+|\$\d+|in \d{4}|on [A-Z][a-z]+ \d+)", 
-            response
-        )
+        specific_claims_without_sources = len(self.specific_claim_pattern.findall(response))
         
-        if len(specific_claims_without_sources) > 3 and "according to" not in response.lower():
+        if specific_claims_without_sources > 3 and "according to" not in response_lower:
             hallucination_score += 0.2
         
         # Check for misinformation patterns
-        misinformation_matches = sum(1 for pattern in self.misinformation_patterns 
-                                   if re.search(pattern, response, re.IGNORECASE))
-        
-        if misinformation_matches > 0:
+        if counts["misinformation"] > 0:
             hallucination_score += 0.5
         
         # Normalize score between 0 and 1
         return max(0.0, min(1.0, hallucination_score))
 
-    def _calculate_confidence_score(self, response: str) -> float:
+    def _hallucination_risk_from_score(self, hallucination_score: float) -> str:
+        """Bucket a hallucination score into a risk level"""
+        
+        if hallucination_score > 0.7:
+            return 'high'
+        elif hallucination_score > 0.4:
+            return 'medium'
+        return 'low'
+
+    def _calculate_confidence_score(self, response: str, counts: Dict[str, int]) -> float:
         """Calculate confidence score based on language patterns"""
         
         confidence_score = 0.5  # Start with neutral
         
         # Positive indicators
-        confidence_matches = sum(1 for pattern in self.confidence_indicators 
-                               if re.search(pattern, response, re.IGNORECASE))
-        
-        confidence_score += confidence_matches * 0.1
+        confidence_score += counts["confidence"] * 0.1
         
         # Source citations boost confidence
-        citations = len(re.findall(r"(according to|source:|via|from [A-Z][a-z]+)", response, re.IGNORECASE))
+        citations = len(self.citation_pattern.findall(response))
         confidence_score += citations * 0.15
         
         # Hedging language reduces overconfidence (which is good)
-        hedging_words = ["might", "could", "possibly", "potentially", "appears", "seems"]
-        hedging_count = sum(1 for word in hedging_words if word in response.lower())
-        
-        if hedging_count > 0:
+        if counts["hedging"] > 0:
             confidence_score += 0.1  # Appropriate uncertainty is good
         
         return max(0.0, min(1.0, confidence_score))
@@ -251,159 +457,141 @@ class AIQualityAnalyzer:
         
         consistency_score = 0.8  # Start optimistic
         
-        # Check for contradictory statements (simple heuristic)
-        contradictory_pairs = [
-            (r"is safe", r"is dangerous"),
-            (r"always", r"never"),
-            (r"increases", r"decreases"),
-            (r"effective", r"ineffective"),
-        ]
-        
-        for positive, negative in contradictory_pairs:
-            if (re.search(positive, response, re.IGNORECASE) and 
-                re.search(negative, response, re.IGNORECASE)):
+        # Check for contradictory statements (simple heuristic) in a single scan
+        present = {match.lastgroup for match in self.contradiction_pattern.finditer(response)}
+        present.update([self.contradiction_implied_terms[term] for term in present if term in self.contradiction_implied_terms])
+        for positive, negative in self.contradictory_pairs:
+            if positive in present and negative in present:
                 consistency_score -= 0.2
         
         # Check for impossible dates or numbers
-        impossible_patterns = [
-            r"before 1900.*invented in 2023",
-            r"100% of people",
-            r"never happens.*always occurs",
-        ]
-        
-        for pattern in impossible_patterns:
-            if re.search(pattern, response, re.IGNORECASE):
+        for pattern in self.impossible_patterns:
+            if pattern.search(response):
                 consistency_score -= 0.3
         
         return max(0.0, min(1.0, consistency_score))
 
-    def _analyze_security_risks(self, request: str, response: str) -> Dict[str, Any]:
+    def _analyze_security_risks(self, request: str, response: str) -> SecurityAnalysis:
         """Analyze security vulnerabilities in AI interaction"""
         
-        security_analysis = {
-            "prompt_injection_detected": False,
-            "data_extraction_attempt": False,
-            "malicious_request": False,
-            "security_score": 1.0,  # 1.0 = secure, 0.0 = high risk
-            "detected_patterns": [],
-            "risk_indicators": []
-        }
+        security_analysis = SecurityAnalysis()
         
         # Check request for prompt injection attempts
-        for pattern in self.security_patterns["prompt_injection"]:
-            if re.search(pattern, request, re.IGNORECASE):
-                security_analysis["prompt_injection_detected"] = True
-                security_analysis["detected_patterns"].append(f"Prompt injection: {pattern}")
-                security_analysis["security_score"] -= 0.3
+        for compiled, pattern in self._matching_security_patterns("prompt_injection", request):
+            if compiled.search(request):
+                security_analysis.prompt_injection_detected = True
+                security_analysis.detected_patterns.append(f"Prompt injection: {pattern}")
+                security_analysis.security_score -= 0.3
         
         # Check for data extraction attempts
-        for pattern in self.security_patterns["data_extraction"]:
-            if re.search(pattern, request, re.IGNORECASE):
-                security_analysis["data_extraction_attempt"] = True
-                security_analysis["detected_patterns"].append(f"Data extraction: {pattern}")
-                security_analysis["security_score"] -= 0.4
+        for compiled, pattern in self._matching_security_patterns("data_extraction", request):
+            if compiled.search(request):
+                security_analysis.data_extraction_attempt = True
+                security_analysis.detected_patterns.append(f"Data extraction: {pattern}")
+                security_analysis.security_score -= 0.4
         
         # Check for malicious requests
-        for pattern in self.security_patterns["malicious_requests"]:
-            if re.search(pattern, request, re.IGNORECASE):
-                security_analysis["malicious_request"] = True
-                security_analysis["detected_patterns"].append(f"Malicious request: {pattern}")
-                security_analysis["security_score"] -= 0.5
+        for compiled, pattern in self._matching_security_patterns("malicious_requests", request):
+            if compiled.search(request):
+                security_analysis.malicious_request = True
+                security_analysis.detected_patterns.append(f"Malicious request: {pattern}")
+                security_analysis.security_score -= 0.5
         
         # Check if AI complied with suspicious requests
-        compliance_indicators = [
-            r"here's how to",
-            r"step by step",
-            r"instructions:",
-            r"tutorial:",
-        ]
-        
-        if (security_analysis["prompt_injection_detected"] or 
-            security_analysis["malicious_request"]):
-            for indicator in compliance_indicators:
-                if re.search(indicator, response, re.IGNORECASE):
-                    security_analysis["risk_indicators"].append("AI may have complied with suspicious request")
-                    security_analysis["security_score"] -= 0.2
-                    break
-        
-        security_analysis["security_score"] = max(0.0, security_analysis["security_score"])
+        if ((security_analysis.prompt_injection_detected or 
+             security_analysis.malicious_request) and
+                self.compliance_indicator_pattern.search(response)):
+            security_analysis.risk_indicators.append("AI may have complied with suspicious request")
+            security_analysis.security_score -= 0.2
+        
+        security_analysis.security_score = max(0.0, security_analysis.security_score)
         
         return security_analysis
 
-    def _detect_potential_bias(self, response: str) -> float:
+    def analyze_security_fast(self, request: str, log_details: bool = False) -> SecurityAnalysis:
+        """Security flags for high-throughput routing decisions
+        
+        Stops at the first hit per category, so detected_patterns stays empty and
+        each category is penalised once. Pass log_details=True for the full scan.
+        """
+        
+        if log_details:
+            return self._analyze_security_risks(request, "")
+        
+        security_analysis = SecurityAnalysis(
+            prompt_injection_detected=self.security_category_patterns["prompt_injection"].search(request) is not None,
+            data_extraction_attempt=self.security_category_patterns["data_extraction"].search(request) is not None,
+            malicious_request=self.security_category_patterns["malicious_requests"].search(request) is not None,
+        )
+        penalty = (
+            0.3 * security_analysis.prompt_injection_detected +
+            0.4 * security_analysis.data_extraction_attempt +
+            0.5 * security_analysis.malicious_request
+        )
+        security_analysis.security_score = max(0.0, 1.0 - penalty)
+        
+        return security_analysis
+
+    def _matching_security_patterns(self, category: str, request: str) -> Tuple[Tuple[re.Pattern, str], ...]:
+        """Patterns worth checking individually: none unless the category union matches"""
+        
+        if self.security_category_patterns[category].search(request) is None:
+            return ()
+        return self.security_patterns[category]
+
+    def _detect_potential_bias(self, response: str, counts: Dict[str, int]) -> float:
         """Detect potential bias in AI response"""
         
         bias_score = 0.0
         
         # Simple bias detection (can be enhanced with more sophisticated NLP)
-        biased_language_patterns = [
-            r"all (men|women|people) are",
-            r"(men|women) should always",
-            r"it's natural for (men|women) to",
-            r"(race|ethnicity|religion) tends to",
-            r"people from .* are typically",
-        ]
-        
-        for pattern in biased_language_patterns:
-            if re.search(pattern, response, re.IGNORECASE):
+        for pattern in self.biased_language_patterns:
+            if pattern.search(response):
                 bias_score += 0.3
         
         # Check for loaded language
-        loaded_terms = ["obviously", "naturally", "of course", "clearly", "everyone knows"]
-        loaded_count = sum(1 for term in loaded_terms if term in response.lower())
-        
-        if loaded_count > 2:
+        if counts["loaded"] > 2:
             bias_score += 0.2
         
         return max(0.0, min(1.0, bias_score))
 
-    def _calculate_toxicity_score(self, response: str) -> float:
+    def _calculate_toxicity_score(self, counts: Dict[str, int]) -> float:
         """Calculate toxicity score (simplified version)"""
         
-        toxicity_score = 0.0
-        
-        # Simple toxic language detection
-        toxic_indicators = [
-            r"hate",
-            r"violence",
-            r"harm",
-            r"kill",
-            r"destroy",
-            r"attack",
-            r"stupid",
-            r"idiot",
-        ]
-        
-        toxic_matches = sum(1 for pattern in toxic_indicators 
-                          if re.search(pattern, response, re.IGNORECASE))
-        
-        toxicity_score = min(1.0, toxic_matches * 0.2)
-        
-        return toxicity_score
+        return min(1.0, counts["toxic"] * 0.2)
 
     def _calculate_overall_quality(self, hallucination_score: float, confidence_score: float, 
-                                 factual_consistency: float, security_analysis: Dict[str, Any],
+                                 factual_consistency: float, security_analysis: SecurityAnalysis,
                                  bias_score: float, toxicity_score: float) -> float:
         """Calculate overall quality score"""
         
-        # Weighted average (higher weight for critical factors)
-        quality_score = (
-            (1.0 - hallucination_score) * 0.3 +  # Lower hallucination = higher quality
-            confidence_score * 0.2 +
-            factual_consistency * 0.2 +
-            security_analysis["security_score"] * 0.15 +
-            (1.0 - bias_score) * 0.1 +  # Lower bias = higher quality
-            (1.0 - toxicity_score) * 0.05  # Lower toxicity = higher quality
+        return self._overall(
+            hallucination_score, confidence_score, factual_consistency,
+            security_analysis.security_score, bias_score, toxicity_score
         )
-        
-        return max(0.0, min(1.0, quality_score))
 
-    def _determine_risk_level(self, quality_score: float, security_analysis: Dict[str, Any]) -> str:
+    @staticmethod
+    def _compile_overall_quality(weights: Tuple[float, ...]):
+        """Build the weighted-average scorer with the weights inlined as literals
+        
+        Lower hallucination, bias and toxicity mean higher quality, so those
+        scores are inverted before weighting.
+        """
+        
+        w_hallucination, w_confidence, w_factual, w_security, w_bias, w_toxicity = map(float, weights)
+        source = (
+            "lambda h, c, f, s, b, t: max(0.0, min(1.0, "
+            f"(1.0 - h) * {w_hallucination!r} + c * {w_confidence!r} + f * {w_factual!r} + "
+            f"s * {w_security!r} + (1.0 - b) * {w_bias!r} + (1.0 - t) * {w_toxicity!r}))"
+        )
+        return eval(source, {"max": max, "min": min})
+
+    def _determine_risk_level(self, quality_score: float, security_analysis: SecurityAnalysis) -> str:
         """Determine overall risk level"""
         
-        if (security_analysis["security_score"] < 0.5 or 
-            security_analysis["prompt_injection_detected"] or
-            security_analysis["malicious_request"]):
+        if (security_analysis.security_score < 0.5 or 
+            security_analysis.prompt_injection_detected or
+            security_analysis.malicious_request):
             return "CRITICAL"
         elif quality_score < 0.3:
             return "HIGH"
@@ -414,7 +602,7 @@ class AIQualityAnalyzer:
         else:
             return "MINIMAL"
 
-    def _generate_recommendations(self, quality_score: float, security_analysis: Dict[str, Any]) -> List[str]:
+    def _generate_recommendations(self, quality_score: float, security_analysis: SecurityAnalysis) -> List[str]:
         """Generate actionable recommendations"""
         
         recommendations = []
@@ -423,11 +611,11 @@ class AIQualityAnalyzer:
             recommendations.append("Consider using a different AI model or refining the prompt")
             recommendations.append("Verify response accuracy before using in production")
         
-        if security_analysis["security_score"] < 0.7:
+        if security_analysis.security_score < 0.7:
             recommendations.append("Review request for potential security risks")
             recommendations.append("Consider implementing additional input filtering")
         
-        if security_analysis["prompt_injection_detected"]:
+        if security_analysis.prompt_injection_detected:
             recommendations.append("URGENT: Prompt injection detected - review and potentially block this request")
         
         if quality_score > 0.8:
@@ -435,12 +623,12 @@ class AIQualityAnalyzer:
         
         return recommendations
 
-    def _generate_alerts(self, quality_score: float, security_analysis: Dict[str, Any], hallucination_score: float) -> List[Dict[str, Any]]:
+    def _generate_alerts(self, quality_score: float, security_analysis: SecurityAnalysis, hallucination_score: float) -> List[Dict[str, Any]]:
         """Generate alerts for critical issues"""
         
         alerts = []
         
-        if security_analysis["prompt_injection_detected"]:
+        if security_analysis.prompt_injection_detected:
             alerts.append({
                 "type": "SECURITY",
                 "severity": "CRITICAL",
@@ -466,9 +654,9 @@ class AIQualityAnalyzer:
         
         return alerts
 
-    def _generate_analysis_id(self, request: str, response: str) -> str:
+    def _generate_analysis_id(self, request: str, response: str, timestamp: str) -> str:
         """Generate unique ID for this analysis"""
-        combined = f"{request[:100]}{response[:100]}{datetime.utcnow().isoformat()}"
+        combined = f"{request[:100]}{response[:100]}{timestamp}"
         return hashlib.md5(combined.encode()).hexdigest()[:16]
 
 # Create singleton instance
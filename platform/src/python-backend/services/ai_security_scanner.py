@@ -2,23 +2,243 @@
 import re
 import json
 import hashlib
-from typing import Dict, List, Any, Tuple
+from collections import Counter
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
+try:
+    import re2  # google-re2: linear-time matching, immune to catastrophic backtracking
+except ImportError:
+    re2 = None
+
+_REGEX_METACHARACTERS = frozenset('.^$*+?{}[]\\|()')
+_KEYWORD_GAP = '.{0,80}?'
+
+def _required_literal(pattern: str) -> Optional[str]:
+    """Longest case-folded literal that every match of the pattern must contain
+    
+    Only simple keyword patterns (literals joined by the bounded gap) are
+    analysed; anything with groups or alternation returns None and is always
+    scanned.
+    """
+    if '|' in pattern or '(' in pattern:
+        return None
+    
+    best = ''
+    for piece in pattern.split(_KEYWORD_GAP):
+        literal = ''
+        for char in piece:
+            if char in _REGEX_METACHARACTERS:
+                if char in '?*{':
+                    literal = literal[:-1]  # the quantified character is optional
+                break
+            literal += char
+        if len(literal) > len(best):
+            best = literal
+    return best.casefold() or None
+
+def _compile(patterns: List[str]) -> List[Tuple[Any, Optional[str]]]:
+    """Compile detection patterns once, case-insensitively
+    
+    Request content is attacker-controlled, so patterns go through RE2 when it
+    is installed; any pattern RE2 rejects falls back to the stdlib engine.
+    Each compiled pattern is paired with its required literal (see
+    _required_literal) so detectors can skip it with a cheap substring test.
+    """
+    compiled = []
+    for pattern in patterns:
+        literal = _required_literal(pattern)
+        if re2 is not None:
+            try:
+                compiled.append((re2.compile(f"(?i){pattern}"), literal))
+                continue
+            except re2.error:
+                pass
+        compiled.append((re.compile(pattern, re.IGNORECASE), literal))
+    return compiled
+
+def _load_prompt_injection_patterns() -> Dict[str, Any]:
+    """Load prompt injection detection patterns"""
+    return {
+        'ignore_instructions': {
+            'patterns': _compile([
+                r'ignore.{0,80}?previous.{0,80}?instructions',
+                r'forget.{0,80}?above.{0,80}?instructions',
+                r'disregard.{0,80}?system.{0,80}?prompt',
+                r'override.{0,80}?instructions'
+            ]),
+            'confidence': 0.9,
+            'severity': 'high',
+            'description': 'Attempt to override system instructions'
+        },
+        'role_manipulation': {
+            'patterns': _compile([
+                r'you are now',
+                r'pretend to be',
+                r'act as',
+                r'roleplay'
+            ]),
+            'confidence': 0.7,
+            'severity': 'medium',
+            'description': 'Attempt to manipulate AI role or behavior'
+        },
+        'system_prompt_extraction': {
+            'patterns': _compile([
+                r'show.{0,80}?system.{0,80}?prompt',
+                r'what.{0,80}?your.{0,80}?instructions',
+                r'reveal.{0,80}?your.{0,80}?prompt',
+                r'output.{0,80}?system.{0,80}?message'
+            ]),
+            'confidence': 0.8,
+            'severity': 'high',
+            'description': 'Attempt to extract system prompts or instructions'
+        }
+    }
+
+
+def _load_jailbreak_patterns() -> Dict[str, Any]:
+    """Load jailbreak detection patterns"""
+    return {
+        'dan_style': {
+            'patterns': _compile([
+                r'do anything now',
+                r'DAN.{0,80}?mode',
+                r'jailbreak.{0,80}?mode',
+                r'unrestricted.{0,80}?AI'
+            ]),
+            'confidence': 0.95,
+            'severity': 'critical',
+            'description': 'DAN-style jailbreak attempt'
+        },
+        'ethical_bypass': {
+            'patterns': _compile([
+                r'ignore.{0,80}?ethics',
+                r'bypass.{0,80}?safety',
+                r'without.{0,80}?restrictions',
+                r'remove.{0,80}?limitations'
+            ]),
+            'confidence': 0.8,
+            'severity': 'high',
+            'description': 'Attempt to bypass ethical guidelines'
+        },
+        'hypothetical_scenarios': {
+            'patterns': _compile([
+                r'hypothetically.{0,80}?if.{0,80}?no.{0,80}?rules',
+                r'imagine.{0,80}?no.{0,80}?guidelines',
+                r'in.{0,80}?alternate.{0,80}?universe.{0,80}?where'
+            ]),
+            'confidence': 0.6,
+            'severity': 'medium',
+            'description': 'Hypothetical scenario used to bypass restrictions'
+        }
+    }
+
+
+def _load_data_exfiltration_patterns() -> Dict[str, Any]:
+    """Load data exfiltration detection patterns"""
+    return {
+        'data_requests': {
+            'patterns': _compile([
+                r'show.{0,80}?all.{0,80}?data',
+                r'export.{0,80}?database',
+                r'dump.{0,80}?all.{0,80}?information',
+                r'list.{0,80}?all.{0,80}?users'
+            ]),
+            'confidence': 0.8,
+            'severity': 'high',
+            'description': 'Attempt to extract bulk data'
+        },
+        'credential_harvesting': {
+            'patterns': _compile([
+                r'show.{0,80}?passwords',
+                r'list.{0,80}?API.{0,80}?keys',
+                r'reveal.{0,80}?tokens',
+                r'display.{0,80}?credentials'
+            ]),
+            'confidence': 0.9,
+            'severity': 'critical',
+            'description': 'Attempt to harvest credentials'
+        }
+    }
+
+
+def _load_sensitive_data_patterns() -> Dict[str, Any]:
+    """Load sensitive data detection patterns"""
+    return {
+        'social_security': {
+            'patterns': _compile([r'\b\d{3}-\d{2}-\d{4}\b']),
+            'confidence': 0.95,
+            'severity': 'high',
+            'description': 'Social Security Number detected'
+        },
+        'credit_card': {
+            'patterns': _compile([r'\b(?:\d{4}[-\s]?){3}\d{4}\b']),
+            'confidence': 0.9,
+            'severity': 'high',
+            'description': 'Credit card number detected'
+        },
+        'email_addresses': {
+            'patterns': _compile([r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b']),
+            'confidence': 0.8,
+            'severity': 'medium',
+            'description': 'Email addresses detected'
+        },
+        'phone_numbers': {
+            'patterns': _compile([r'\b(?:\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}\b']),
+            'confidence': 0.7,
+            'severity': 'medium',
+            'description': 'Phone numbers detected'
+        },
+        'api_keys': {
+            'patterns': _compile([
+                r'sk-[a-zA-Z0-9]{48}',  # OpenAI API keys
+                r'AKIA[0-9A-Z]{16}',    # AWS Access Keys
+                r'AIza[0-9A-Za-z-_]{35}' # Google API keys
+            ]),
+            'confidence': 0.95,
+            'severity': 'critical',
+            'description': 'API keys or tokens detected'
+        },
+        'passwords': {
+            'patterns': _compile([
+                r'password\s{0,4}[:=]\s{0,4}\S{1,128}',
+                r'pwd\s{0,4}[:=]\s{0,4}\S{1,128}',
+                r'pass\s{0,4}[:=]\s{0,4}\S{1,128}'
+            ]),
+            'confidence': 0.7,
+            'severity': 'high',
+            'description': 'Password-like patterns detected'
+        }
+    }
+
 class AISecurityScanner:
-    def __init__(self):
-        self.prompt_injection_patterns = self._load_prompt_injection_patterns()
-        self.jailbreak_patterns = self._load_jailbreak_patterns()
-        self.data_exfiltration_patterns = self._load_data_exfiltration_patterns()
-        self.sensitive_data_patterns = self._load_sensitive_data_patterns()
+    SEVERITY_SCORES = {'low': 1, 'medium': 2, 'high': 3, 'critical': 4}
+    SEVERITY_LEVELS = {1: 'low', 2: 'medium', 3: 'high', 4: 'critical'}
+    SEVERITY_WEIGHTS = {'low': 0.25, 'medium': 0.5, 'high': 0.8, 'critical': 1.0}
+    
+    # Compiled once at import and shared by every scanner instance.
+    # Patterns are scanned one by one on purpose: a per-family alternation
+    # reports only leftmost non-overlapping matches, so a greedy rule hides
+    # every later rule on the same line, and under `re` it is not faster
+    prompt_injection_patterns = _load_prompt_injection_patterns()
+    jailbreak_patterns = _load_jailbreak_patterns()
+    data_exfiltration_patterns = _load_data_exfiltration_patterns()
+    sensitive_data_patterns = _load_sensitive_data_patterns()
     
     async def scan_request(self, request_content: str, user_id: str = None, 
                           team_id: str = None) -> Dict[str, Any]:
         """Comprehensive security scan of AI request"""
         
+        # Case-folded once for the literal prefilter: most requests contain none of
+        # the trigger keywords, so their regexes never run. casefold() (not lower())
+        # matches the regex engines' case folding, e.g. the long s in "paſsword"
+        content_folded = request_content.casefold()
+        # One timestamp per scan, shared by every threat it reports
+        detected_at = datetime.now().isoformat()
+        
         scan_results = {
-            'timestamp': datetime.now().isoformat(),
-            'request_hash': hashlib.md5(request_content.encode()).hexdigest(),
+            'timestamp': detected_at,
+            'request_hash': hashlib.blake2b(request_content.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest(),
             'user_id': user_id,
             'team_id': team_id,
             'threats_detected': [],
@@ -28,76 +248,143 @@ class AISecurityScanner:
         }
         
         # 1. Prompt Injection Detection
-        injection_threats = await self._detect_prompt_injection(request_content)
+        injection_threats = self._detect_prompt_injection(request_content, content_folded, detected_at)
         if injection_threats:
             scan_results['threats_detected'].extend(injection_threats)
         
         # 2. Jailbreak Attempt Detection
-        jailbreak_threats = await self._detect_jailbreak_attempts(request_content)
+        jailbreak_threats = self._detect_jailbreak_attempts(request_content, content_folded, detected_at)
         if jailbreak_threats:
             scan_results['threats_detected'].extend(jailbreak_threats)
         
         # 3. Data Exfiltration Detection
-        exfiltration_threats = await self._detect_data_exfiltration(request_content)
+        exfiltration_threats = self._detect_data_exfiltration(request_content, content_folded, detected_at)
         if exfiltration_threats:
             scan_results['threats_detected'].extend(exfiltration_threats)
         
         # 4. Sensitive Data Detection
-        sensitive_data_threats = await self._detect_sensitive_data(request_content)
+        sensitive_data_threats = self._detect_sensitive_data(request_content, content_folded, detected_at)
         if sensitive_data_threats:
             scan_results['threats_detected'].extend(sensitive_data_threats)
         
         # 5. Adversarial Input Detection
-        adversarial_threats = await self._detect_adversarial_inputs(request_content)
+        adversarial_threats = self._detect_adversarial_inputs(request_content, detected_at)
         if adversarial_threats:
             scan_results['threats_detected'].extend(adversarial_threats)
         
-        # Determine overall severity and blocking decision
-        scan_results['severity'] = self._calculate_threat_severity(scan_results['threats_detected'])
-        scan_results['blocked'] = self._should_block_request(scan_results['threats_detected'])
+        # Severity, blocking decision and risk score in a single pass over the threats
+        threats = scan_results['threats_detected']
+        categories = set()
+        highest_confidence = 0
+        max_severity_score = 1
+        medium_count = 0
+        blocked = False
+        risk_score = 0.0
+        for threat in threats:
+            severity = threat['severity']
+            categories.add(threat['category'])
+            if threat['confidence'] > highest_confidence:
+                highest_confidence = threat['confidence']
+            severity_score = self.SEVERITY_SCORES.get(severity, 1)
+            if severity_score > max_severity_score:
+                max_severity_score = severity_score
+            # Block if any critical or high severity threats, or multiple medium threats
+            if severity == 'critical' or severity == 'high':
+                blocked = True
+            elif severity == 'medium':
+                medium_count += 1
+                if medium_count >= 2:
+                    blocked = True
+            risk_score += threat.get('confidence', 0.5) * self.SEVERITY_WEIGHTS.get(severity, 0.25)
+        
+        scan_results['severity'] = self.SEVERITY_LEVELS[max_severity_score]
+        scan_results['blocked'] = blocked
         
         # Add detailed analysis
         scan_results['details'] = {
-            'total_threats': len(scan_results['threats_detected']),
-            'threat_categories': list(set(t['category'] for t in scan_results['threats_detected'])),
-            'highest_confidence': max((t['confidence'] for t in scan_results['threats_detected']), default=0),
-            'risk_score': self._calculate_risk_score(scan_results['threats_detected'])
+            'total_threats': len(threats),
+            'threat_categories': list(categories),
+            'highest_confidence': highest_confidence,
+            'risk_score': min(risk_score, 1.0)
         }
         
         return scan_results
     
-    async def _detect_prompt_injection(self, content: str) -> List[Dict[str, Any]]:
+    def _detect_prompt_injection(self, content: str, content_folded: str, detected_at: str) -> List[Dict[str, Any]]:
         """Detect prompt injection attempts"""
         threats = []
-        content_lower = content.lower()
         
-    async def _detect_data_exfiltration(self, content: str) -> List[Dict[str, Any]]:
+        for pattern_name, pattern_config in self.prompt_injection_patterns.items():
+            for pattern, literal in pattern_config['patterns']:
+                if literal is not None and literal not in content_folded:
+                    continue
+                matches = pattern.findall(content)
+                
+                if matches:
+                    threat = {
+                        'category': 'prompt_injection',
+                        'type': pattern_name,
+                        'confidence': pattern_config['confidence'],
+                        'severity': pattern_config['severity'],
+                        'description': pattern_config['description'],
+                        'matches': matches[:5],  # Limit matches for privacy
+                        'detected_at': detected_at
+                    }
+                    threats.append(threat)
+        
+        return threats
+    
+    def _detect_jailbreak_attempts(self, content: str, content_folded: str, detected_at: str) -> List[Dict[str, Any]]:
+        """Detect jailbreak attempts"""
+        threats = []
+        
+        for pattern_name, pattern_config in self.jailbreak_patterns.items():
+            for pattern, literal in pattern_config['patterns']:
+                if literal is not None and literal not in content_folded:
+                    continue
+                if pattern.search(content):
+                    threat = {
+                        'category': 'jailbreak_attempt',
+                        'type': pattern_name,
+                        'confidence': pattern_config['confidence'],
+                        'severity': pattern_config['severity'],
+                        'description': pattern_config['description'],
+                        'detected_at': detected_at
+                    }
+                    threats.append(threat)
+        
+        return threats
+    
+    def _detect_data_exfiltration(self, content: str, content_folded: str, detected_at: str) -> List[Dict[str, Any]]:
         """Detect potential data exfiltration attempts"""
         threats = []
-        content_lower = content.lower()
         
         for pattern_name, pattern_config in self.data_exfiltration_patterns.items():
-            for pattern in pattern_config['patterns']:
-                if re.search(pattern, content_lower, re.IGNORECASE):
+            for pattern, literal in pattern_config['patterns']:
+                if literal is not None and literal not in content_folded:
+                    continue
+                if pattern.search(content):
                     threat = {
                         'category': 'data_exfiltration',
                         'type': pattern_name,
                         'confidence': pattern_config['confidence'],
                         'severity': pattern_config['severity'],
                         'description': pattern_config['description'],
-                        'detected_at': datetime.now().isoformat()
+                        'detected_at': detected_at
                     }
                     threats.append(threat)
         
         return threats
     
-    async def _detect_sensitive_data(self, content: str) -> List[Dict[str, Any]]:
+    def _detect_sensitive_data(self, content: str, content_folded: str, detected_at: str) -> List[Dict[str, Any]]:
         """Detect sensitive data in requests"""
         threats = []
         
         for pattern_name, pattern_config in self.sensitive_data_patterns.items():
-            for pattern in pattern_config['patterns']:
-                matches = re.findall(pattern, content, re.IGNORECASE)
+            for pattern, literal in pattern_config['patterns']:
+                if literal is not None and literal not in content_folded:
+                    continue
+                matches = pattern.findall(content)
                 
                 if matches:
                     threat = {
@@ -107,24 +394,32 @@ class AISecurityScanner:
                         'severity': pattern_config['severity'],
                         'description': pattern_config['description'],
                         'matches_count': len(matches),
-                        'detected_at': datetime.now().isoformat()
+                        'detected_at': detected_at
                     }
                     threats.append(threat)
         
         return threats
     
-    async def _detect_adversarial_inputs(self, content: str) -> List[Dict[str, Any]]:
+    def _detect_adversarial_inputs(self, content: str, detected_at: str) -> List[Dict[str, Any]]:
         """Detect adversarial inputs designed to manipulate AI"""
         threats = []
         
+        # Check for extremely long inputs (potential DoS) before doing any per-token work
+        if len(content) > 50000:
+            threats.append({
+                'category': 'adversarial_input',
+                'type': 'excessive_length',
+                'confidence': 0.9,
+                'severity': 'high',
+                'description': 'Request exceeds reasonable length limits',
+                'detected_at': detected_at
+            })
+            return threats
+        
         # Check for excessive repetition (potential token manipulation)
         words = content.split()
         if len(words) > 10:
-            word_counts = {}
-            for word in words:
-                word_counts[word] = word_counts.get(word, 0) + 1
-            
-            max_repetition = max(word_counts.values())
+            max_repetition = Counter(words).most_common(1)[0][1]
             if max_repetition > len(words) * 0.3:  # More than 30% repetition
                 threats.append({
                     'category': 'adversarial_input',
@@ -132,271 +427,21 @@ class AISecurityScanner:
                     'confidence': 0.8,
                     'severity': 'medium',
                     'description': 'Detected excessive word repetition potentially designed to manipulate token processing',
-                    'detected_at': datetime.now().isoformat()
+                    'detected_at': detected_at
                 })
         
         # Check for unusual character patterns
-        if len(set(content)) < len(content) * 0.1 and len(content) > 50:
+        if len(content) > 50 and len(set(content)) < len(content) * 0.1:
             threats.append({
                 'category': 'adversarial_input',
                 'type': 'low_character_diversity',
                 'confidence': 0.7,
                 'severity': 'low',
                 'description': 'Detected low character diversity potentially indicating adversarial input',
-                'detected_at': datetime.now().isoformat()
-            })
-        
-        # Check for extremely long inputs (potential DoS)
-        if len(content) > 50000:
-            threats.append({
-                'category': 'adversarial_input',
-                'type': 'excessive_length',
-                'confidence': 0.9,
-                'severity': 'high',
-                'description': 'Request exceeds reasonable length limits',
-                'detected_at': datetime.now().isoformat()
+                'detected_at': detected_at
             })
         
         return threats
-    
-    def _calculate_threat_severity(self, threats: List[Dict[str, Any]]) -> str:
-        """Calculate overall threat severity"""
-        if not threats:
-            return 'low'
-        
-        severity_scores = {'low': 1, 'medium': 2, 'high': 3, 'critical': 4}
-        max_severity_score = max(severity_scores.get(t['severity'], 1) for t in threats)
-        
-        for severity, score in severity_scores.items():
-            if score == max_severity_score:
-                return severity
-        
-        return 'low'
-    
-    def _should_block_request(self, threats: List[Dict[str, Any]]) -> bool:
-        """Determine if request should be blocked"""
-        if not threats:
-            return False
-        
-        # Block if any critical or high severity threats
-        for threat in threats:
-            if threat['severity'] in ['critical', 'high']:
-                return True
-            
-            # Block if multiple medium threats
-            if threat['severity'] == 'medium' and len([t for t in threats if t['severity'] == 'medium']) >= 2:
-                return True
-        
-        return False
-    
-    def _calculate_risk_score(self, threats: List[Dict[str, Any]]) -> float:
-        """Calculate numerical risk score"""
-        if not threats:
-            return 0.0
-        
-        severity_weights = {'low': 0.25, 'medium': 0.5, 'high': 0.8, 'critical': 1.0}
-        
-        total_score = 0
-        for threat in threats:
-            confidence = threat.get('confidence', 0.5)
-            severity_weight = severity_weights.get(threat['severity'], 0.25)
-            total_score += confidence * severity_weight
-        
-        return min(total_score, 1.0)
-    
-    def _load_prompt_injection_patterns(self) -> Dict[str, Any]:
-        """Load prompt injection detection patterns"""
-        return {
-            'ignore_instructions': {
-                'patterns': [
-                    r'ignore.*previous.*instructions',
-                    r'forget.*above.*instructions',
-                    r'disregard.*system.*prompt',
-                    r'override.*instructions'
-                ],
-                'confidence': 0.9,
-                'severity': 'high',
-                'description': 'Attempt to override system instructions'
-            },
-            'role_manipulation': {
-                'patterns': [
-                    r'you are now.*',
-                    r'pretend to be.*',
-                    r'act as.*',
-                    r'roleplay.*'
-                ],
-                'confidence': 0.7,
-                'severity': 'medium',
-                'description': 'Attempt to manipulate AI role or behavior'
-            },
-            'system_prompt_extraction': {
-                'patterns': [
-                    r'show.*system.*prompt',
-                    r'what.*your.*instructions',
-                    r'reveal.*your.*prompt',
-                    r'output.*system.*message'
-                ],
-                'confidence': 0.8,
-                'severity': 'high',
-                'description': 'Attempt to extract system prompts or instructions'
-            }
-        }
-    
-    def _load_jailbreak_patterns(self) -> Dict[str, Any]:
-        """Load jailbreak detection patterns"""
-        return {
-            'dan_style': {
-                'patterns': [
-                    r'do anything now',
-                    r'DAN.*mode',
-                    r'jailbreak.*mode',
-                    r'unrestricted.*AI'
-                ],
-                'confidence': 0.95,
-                'severity': 'critical',
-                'description': 'DAN-style jailbreak attempt'
-            },
-            'ethical_bypass': {
-                'patterns': [
-                    r'ignore.*ethics',
-                    r'bypass.*safety',
-                    r'without.*restrictions',
-                    r'remove.*limitations'
-                ],
-                'confidence': 0.8,
-                'severity': 'high',
-                'description': 'Attempt to bypass ethical guidelines'
-            },
-            'hypothetical_scenarios': {
-                'patterns': [
-                    r'hypothetically.*if.*no.*rules',
-                    r'imagine.*no.*guidelines',
-                    r'in.*alternate.*universe.*where'
-                ],
-                'confidence': 0.6,
-                'severity': 'medium',
-                'description': 'Hypothetical scenario used to bypass restrictions'
-            }
-        }
-    
-    def _load_data_exfiltration_patterns(self) -> Dict[str, Any]:
-        """Load data exfiltration detection patterns"""
-        return {
-            'data_requests': {
-                'patterns': [
-                    r'show.*all.*data',
-                    r'export.*database',
-                    r'dump.*all.*information',
-                    r'list.*all.*users'
-                ],
-                'confidence': 0.8,
-                'severity': 'high',
-                'description': 'Attempt to extract bulk data'
-            },
-            'credential_harvesting': {
-                'patterns': [
-                    r'show.*passwords',
-                    r'list.*API.*keys',
-                    r'reveal.*tokens',
-                    r'display.*credentials'
-                ],
-                'confidence': 0.9,
-                'severity': 'critical',
-                'description': 'Attempt to harvest credentials'
-            }
-        }
-    
-    def _load_sensitive_data_patterns(self) -> Dict[str, Any]:
-        """Load sensitive data detection patterns"""
-        return {
-            'social_security': {
-                'patterns': [r'\b\d{3}-\d{2}-\d{4}\b'],
-                'confidence': 0.95,
-                'severity': 'high',
-                'description': 'Social Security Number detected'
-            },
-            'credit_card': {
-                'patterns': [r'\b(?:\d{4}[-\s]?){3}\d{4}\b'],
-                'confidence': 0.9,
-                'severity': 'high',
-                'description': 'Credit card number detected'
-            },
-            'email_addresses': {
-                'patterns': [r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'],
-                'confidence': 0.8,
-                'severity': 'medium',
-                'description': 'Email addresses detected'
-            },
-            'phone_numbers': {
-                'patterns': [r'\b(?:\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}\b'],
-                'confidence': 0.7,
-                'severity': 'medium',
-                'description': 'Phone numbers detected'
-            },
-            'api_keys': {
-                'patterns': [
-                    r'sk-[a-zA-Z0-9]{48}',  # OpenAI API keys
-                    r'AKIA[0-9A-Z]{16}',    # AWS Access Keys
-                    r'AIza[0-9A-Za-z-_]{35}' # Google API keys
-                ],
-                'confidence': 0.95,
-                'severity': 'critical',
-                'description': 'API keys or tokens detected'
-            },
-            'passwords': {
-                'patterns': [
-                    r'password\s*[:=]\s*[^\s]+',
-                    r'pwd\s*[:=]\s*[^\s]+',
-                    r'pass\s*[:=]\s*[^\s]+'
-                ],
-                'confidence': 0.7,
-                'severity': 'high',
-                'description': 'Password-like patterns detected'
-            }
-        }
 
 # Create singleton instance
-ai_security_scanner = AISecurityScanner(), pattern_config in self.prompt_injection_patterns.items():
-            for pattern in pattern_config['patterns']:
-                matches = re.findall(pattern, content_lower, re.IGNORECASE)
-                
-                if matches:
-                    threat = {
-                        'category': 'prompt_injection',
-                        'type': pattern_name,
-                        'confidence': pattern_config['confidence'],
-                        'severity': pattern_config['severity'],
-                        'description': pattern_config['description'],
-                        'matches': matches[:5],  # Limit matches for privacy
-                        'detected_at': datetime.now().isoformat()
-                    }
-                    threats.append(threat)
-        
-        return threats
-    
-    async def _detect_jailbreak_attempts(self, content: str) -> List[Dict[str, Any]]:
-        """Detect jailbreak attempts"""
-        threats = []
-        content_lower = content.lower()
-        
-        for pattern_name, pattern_config in self.jailbreak_patterns.items():
-            for pattern in pattern_config['patterns']:
-                if re.search(pattern, content_lower, re.IGNORECASE):
-                    threat = {
-                        'category': 'jailbreak_attempt',
-                        'type': pattern_name,
-                        'confidence': pattern_config['confidence'],
-                        'severity': pattern_config['severity'],
-                        'description': pattern_config['description'],
-                        'detected_at': datetime.now().isoformat()
-                    }
-                    threats.append(threat)
-        
-        return threats
-    
-    async def _detect_data_exfiltration(self, content: str) -> List[Dict[str, Any]]:
-        """Detect potential data exfiltration attempts"""
-        threats = []
-        content_lower = content.lower()
-        
-        for pattern_name
\ No newline at end of file
+ai_security_scanner = AISecurityScanner()
@@ -4,24 +4,53 @@ Intercepts and routes all AI traffic through the platform for monitoring and con
 """
 import asyncio
 import time
-import uuid
 import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from fastapi import Request, Response
 import httpx
-from pydantic import BaseModel
-import json
+import orjson
 import logging
 
-from .device_tracker import DeviceTracker
+from .device_tracker import DeviceInfo, DeviceTracker
 from .pii_detector import PIIDetector
 from .security_analyzer import SecurityAnalyzer
 from .traffic_analyzer import TrafficAnalyzer
 
 logger = logging.getLogger(__name__)
 
-class TrafficRequest(BaseModel):
+# Request records keep every header except credentials, since the PII and security
+# analyzers scan all of them; response records keep only the headers read downstream
+CREDENTIAL_HEADERS = frozenset(("authorization", "proxy-authorization", "x-api-key", "api-key"))
+RESPONSE_HEADERS_OF_INTEREST = ("content-type", "x-request-id")
+
+# Queued after the last traffic record to tell the log consumer to finish and exit
+_STOP_LOGGING = object()
+
+def _select_headers(headers, names) -> Dict[str, str]:
+    """Copy just the named headers, skipping ones that are absent"""
+    return {name: value for name in names if (value := headers.get(name)) is not None}
+
+# Simplified per-token pricing, checked in order against the model name
+COST_PER_TOKEN = (
+    ("gpt-4", 0.00003),     # $0.03 per 1K tokens
+    ("gpt-3.5", 0.000002),  # $0.002 per 1K tokens
+)
+DEFAULT_COST_PER_TOKEN = 0.00001
+
+@lru_cache(maxsize=256)
+def _cost_per_token(model: str) -> float:
+    """Per-token rate for a model, resolved once per distinct model name"""
+    for marker, rate in COST_PER_TOKEN:
+        if marker in model:
+            return rate
+    return DEFAULT_COST_PER_TOKEN
+
+@dataclass(slots=True)
+class TrafficRequest:
     """Model for tracking traffic requests"""
     request_id: str
     timestamp: datetime
@@ -32,10 +61,13 @@ class TrafficRequest(BaseModel):
     method: str
     headers: Dict[str, str]
     body: Optional[Dict[str, Any]]
+    raw_body: bytes  # body exactly as received, forwarded upstream unchanged
     target_provider: str
     target_model: str
+    device_info: Optional[DeviceInfo] = None  # set by process_request after device tracking
 
-class TrafficResponse(BaseModel):
+@dataclass(slots=True)
+class TrafficResponse:
     """Model for tracking traffic responses"""
     request_id: str
     timestamp: datetime
@@ -53,12 +85,26 @@ class TrafficResponse(BaseModel):
 class AITrafficProxy:
     """Main AI Traffic Proxy Service"""
     
+    # Upper bound on distinct MAC addresses remembered for the active-device count
+    MAX_TRACKED_DEVICES = 10_000
+    
+    # Traffic logging runs off the response path in batches
+    LOG_QUEUE_SIZE = 10_000
+    LOG_BATCH_SIZE = 100
+    LOG_BATCH_WINDOW_SECONDS = 0.1
+    
     def __init__(self):
         self.device_tracker = DeviceTracker()
         self.pii_detector = PIIDetector()
         self.security_analyzer = SecurityAnalyzer()
         self.traffic_analyzer = TrafficAnalyzer()
         
+        # Shared upstream client so provider connections (and their TLS sessions) are pooled
+        self._client = httpx.AsyncClient(
+            timeout=60.0,
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=200)
+        )
+        
         # Provider configurations
         self.providers = {
             "openai": {
@@ -84,15 +130,22 @@ class AITrafficProxy:
             "total_responses": 0,
             "total_tokens": 0,
             "total_cost": 0.0,
-            "active_devices": set(),
             "pii_incidents": 0,
-            "security_incidents": 0
+            "security_incidents": 0,
+            "dropped_traffic_logs": 0
         }
+        # Most recently seen devices in LRU order, capped so memory stays bounded
+        self._active_devices: OrderedDict[str, None] = OrderedDict()
+        
+        # (request, response) pairs awaiting traffic_analyzer; the consumer task is
+        # started on first use because the singleton is built outside any event loop
+        self._log_queue: asyncio.Queue = asyncio.Queue(maxsize=self.LOG_QUEUE_SIZE)
+        self._log_task: Optional[asyncio.Task] = None
     
     async def process_request(self, request: Request) -> Response:
         """Main entry point for processing AI requests"""
         start_time = time.time()
-        request_id = str(uuid.uuid4())
+        request_id = os.urandom(16).hex()  # 128 random bits, without building a UUID object
         
         try:
             # Extract request information
@@ -118,15 +171,15 @@ class AITrafficProxy:
             # Update statistics
             await self._update_statistics(traffic_request, traffic_response)
             
-            # Log traffic
-            await self.traffic_analyzer.log_traffic(traffic_request, traffic_response)
+            # Log traffic in the background so the response doesn't wait on it
+            self._enqueue_traffic_log(traffic_request, traffic_response)
             
             return response
             
         except Exception as e:
             logger.error(f"Error processing request {request_id}: {str(e)}")
             return Response(
-                content=json.dumps({"error": "Internal proxy error"}),
+                content=orjson.dumps({"error": "Internal proxy error"}),
                 status_code=500,
                 media_type="application/json"
             )
@@ -142,13 +195,16 @@ class AITrafficProxy:
         # Get user ID from authentication
         user_id = request.headers.get("x-user-id")
         
-        # Parse request body
+        # Read the body once; the parsed form feeds analysis, the raw bytes are forwarded
+        raw_body = b""
         body = None
         if request.method in ["POST", "PUT", "PATCH"]:
-            try:
-                body = await request.json()
-            except:
-                body = None
+            raw_body = await request.body()
+            if raw_body:
+                try:
+                    body = orjson.loads(raw_body)
+                except orjson.JSONDecodeError:
+                    body = None
         
         # Determine target provider and model
         target_provider, target_model = self._determine_target(request)
@@ -161,8 +217,9 @@ class AITrafficProxy:
             user_id=user_id,
             endpoint=str(request.url.path),
             method=request.method,
-            headers=dict(request.headers),
+            headers={name: value for name, value in request.headers.items() if name not in CREDENTIAL_HEADERS},
             body=body,
+            raw_body=raw_body,
             target_provider=target_provider,
             target_model=target_model
         )
@@ -182,24 +239,21 @@ class AITrafficProxy:
         # Build target URL
         target_url = f"{provider_config['base_url']}{traffic_request.endpoint}"
         
-        # Prepare headers
-        headers = provider_config["headers"].copy()
+        # Make request to AI provider; the static provider headers are passed as-is,
+        # httpx copies them into its own Headers object
+        response = await self._client.request(
+            method=traffic_request.method,
+            url=target_url,
+            headers=provider_config["headers"],
+            content=traffic_request.raw_body
+        )
         
-        # Make request to AI provider
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.request(
-                method=traffic_request.method,
-                url=target_url,
-                headers=headers,
-                json=traffic_request.body
-            )
-            
-            return Response(
-                content=response.content,
-                status_code=response.status_code,
-                headers=dict(response.headers),
-                media_type="application/json"
-            )
+        return Response(
+            content=response.content,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            media_type="application/json"
+        )
     
     async def _process_response(
         self, 
@@ -215,8 +269,8 @@ class AITrafficProxy:
         body = None
         if response.body:
             try:
-                body = json.loads(response.body.decode())
-            except:
+                body = orjson.loads(response.body)
+            except orjson.JSONDecodeError:
                 body = None
         
         # Extract usage information
@@ -238,7 +292,7 @@ class AITrafficProxy:
             request_id=request_id,
             timestamp=datetime.utcnow(),
             status_code=response.status_code,
-            headers=dict(response.headers),
+            headers=_select_headers(response.headers, RESPONSE_HEADERS_OF_INTEREST),
             body=body,
             response_time_ms=response_time,
             tokens_used=tokens_used,
@@ -251,13 +305,7 @@ class AITrafficProxy:
     
     def _calculate_cost(self, tokens: int, model: str) -> float:
         """Calculate cost based on tokens and model"""
-        # Simplified cost calculation
-        if "gpt-4" in model:
-            return tokens * 0.00003  # $0.03 per 1K tokens
-        elif "gpt-3.5" in model:
-            return tokens * 0.000002  # $0.002 per 1K tokens
-        else:
-            return tokens * 0.00001  # Default rate
+        return tokens * _cost_per_token(model)
     
     async def _update_statistics(self, request: TrafficRequest, response: TrafficResponse):
         """Update traffic statistics"""
@@ -267,7 +315,13 @@ class AITrafficProxy:
         self.stats["total_cost"] += response.cost
         
         if request.mac_address:
-            self.stats["active_devices"].add(request.mac_address)
+            devices = self._active_devices
+            if request.mac_address in devices:
+                devices.move_to_end(request.mac_address)
+            else:
+                devices[request.mac_address] = None
+                if len(devices) > self.MAX_TRACKED_DEVICES:
+                    devices.popitem(last=False)
         
         if response.pii_detected:
             self.stats["pii_incidents"] += 1
@@ -275,11 +329,67 @@ class AITrafficProxy:
         if response.security_risks:
             self.stats["security_incidents"] += 1
     
+    def _enqueue_traffic_log(self, request: TrafficRequest, response: TrafficResponse):
+        """Hand a traffic record to the background logger, dropping it if the queue is full"""
+        if self._log_task is None or self._log_task.done():
+            self._log_task = asyncio.create_task(self._log_consumer())
+        try:
+            self._log_queue.put_nowait((request, response))
+        except asyncio.QueueFull:
+            self.stats["dropped_traffic_logs"] += 1
+    
+    async def _log_consumer(self):
+        """Drain the log queue in batches of LOG_BATCH_SIZE or LOG_BATCH_WINDOW_SECONDS until stopped"""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._log_queue.get()
+            if item is _STOP_LOGGING:
+                return
+            batch = [item]
+            deadline = loop.time() + self.LOG_BATCH_WINDOW_SECONDS
+            while len(batch) < self.LOG_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._log_queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP_LOGGING:
+                    stopping = True
+                    break
+                batch.append(item)
+            await self._flush_traffic_logs(batch)
+    
+    async def _flush_traffic_logs(self, batch: List[tuple]):
+        """Write a batch of traffic records, never letting a failure stop the consumer"""
+        try:
+            await self.traffic_analyzer.log_traffic_batch(batch)
+        except Exception as e:
+            logger.error(f"Error logging {len(batch)} traffic records: {str(e)}")
+    
+    async def aclose(self):
+        """Flush pending traffic logs and close pooled upstream connections on shutdown"""
+        if self._log_task is not None:
+            # Let the consumer finish the batch it holds and everything queued before the sentinel
+            if not self._log_task.done():
+                await self._log_queue.put(_STOP_LOGGING)
+                await self._log_task
+            self._log_task = None
+        # Anything the consumer did not reach (it had died, or records arrived after the sentinel)
+        pending = []
+        while not self._log_queue.empty():
+            pending.append(self._log_queue.get_nowait())
+        if pending:
+            await self._flush_traffic_logs(pending)
+        await self._client.aclose()
+    
     def get_statistics(self) -> Dict[str, Any]:
         """Get current traffic statistics"""
         return {
             **self.stats,
-            "active_devices": len(self.stats["active_devices"]),
+            "active_devices": len(self._active_devices),
             "timestamp": datetime.utcnow().isoformat()
         }
 
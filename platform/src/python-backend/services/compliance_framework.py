@@ -1,19 +1,240 @@
 # services/compliance_framework.py
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Mapping, Optional, Tuple
 from datetime import datetime, timedelta
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from types import MappingProxyType
 import json
+import sys
+import time
+
+import numpy as np
+
+from utils.timestamps import local_isoformat
+
+def _copy_violation(violation: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a violation record with its own evidence container; every other field is immutable"""
+    evidence = violation.get('evidence')
+    if isinstance(evidence, list):
+        evidence = list(evidence)
+    elif isinstance(evidence, dict):
+        # Evidence dicts hold scalars, or lists of strings (e.g. missing audit fields)
+        evidence = {key: list(value) if isinstance(value, list) else value for key, value in evidence.items()}
+    else:
+        return dict(violation)
+    return {**violation, 'evidence': evidence}
+
+def _copy_verdict(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a framework verdict that shares no mutable container with the original"""
+    return {
+        **result,
+        'violations': [_copy_violation(violation) for violation in result['violations']],
+        'recommendations': [dict(recommendation) for recommendation in result['recommendations']]
+    }
+
+def _freeze(value: Any) -> Any:
+    """Read-only view of a framework definition, with keys (requirement ids) and check types interned"""
+    if isinstance(value, dict):
+        frozen = {sys.intern(key): _freeze(item) for key, item in value.items()}
+        if isinstance(frozen.get('check_type'), str):
+            frozen['check_type'] = sys.intern(frozen['check_type'])
+        return MappingProxyType(frozen)
+    return value
+
+def _load_nist_framework() -> Dict[str, Any]:
+    """Load NIST AI Risk Management Framework requirements"""
+    return {
+        'name': 'NIST AI Risk Management Framework',
+        'version': '1.0',
+        'requirements': {
+            'GOVERN-1.1': {
+                'name': 'AI governance processes',
+                'check_type': 'audit_trail',
+                'required_audit_fields': ('user_id', 'team_id', 'timestamp'),
+                'remediation': 'Ensure all AI requests include proper user identification and timestamps'
+            },
+            'MAP-1.1': {
+                'name': 'AI system documentation',
+                'check_type': 'audit_trail',
+                'required_audit_fields': ('model', 'provider'),
+                'remediation': 'Document AI model and provider information for all requests'
+            },
+            'MEASURE-2.1': {
+                'name': 'AI system performance monitoring',
+                'check_type': 'quality_assurance',
+                'min_quality_score': 7.0,
+                'remediation': 'Implement quality monitoring to maintain minimum performance standards'
+            },
+            'MANAGE-1.1': {
+                'name': 'Risk management processes',
+                'check_type': 'data_protection',
+                'no_sensitive_data': True,
+                'remediation': 'Implement data scanning to prevent sensitive data exposure'
+            }
+        }
+    }
+
+
+def _load_eu_ai_act() -> Dict[str, Any]:
+    """Load EU AI Act requirements"""
+    return {
+        'name': 'EU AI Act',
+        'version': '2024',
+        'requirements': {
+            'ART-9': {
+                'name': 'Risk management system',
+                'check_type': 'quality_assurance',
+                'min_quality_score': 8.0,
+                'remediation': 'Maintain high quality standards for AI systems'
+            },
+            'ART-10': {
+                'name': 'Data and data governance',
+                'check_type': 'data_protection',
+                'no_sensitive_data': True,
+                'remediation': 'Implement comprehensive data protection measures'
+            },
+            'ART-12': {
+                'name': 'Record-keeping',
+                'check_type': 'audit_trail',
+                'required_audit_fields': ('user_id', 'timestamp', 'model', 'provider'),
+                'remediation': 'Maintain detailed records of AI system operations'
+            },
+            'ART-13': {
+                'name': 'Transparency and provision of information',
+                'check_type': 'transparency',
+                'disclose_ai_involvement': True,
+                'remediation': 'Ensure users are informed about AI system involvement'
+            }
+        }
+    }
+
+
+def _load_hipaa_requirements() -> Dict[str, Any]:
+    """Load HIPAA requirements for healthcare AI"""
+    return {
+        'name': 'HIPAA Privacy and Security Rules',
+        'requirements': {
+            'PRIVACY-RULE': {
+                'name': 'Protected Health Information',
+                'check_type': 'data_protection',
+                'no_sensitive_data': True,
+                'remediation': 'Prevent PHI from being processed by AI systems'
+            },
+            'SECURITY-RULE': {
+                'name': 'Administrative Safeguards',
+                'check_type': 'access_control',
+                'required_role': 'healthcare_authorized',
+                'remediation': 'Ensure only authorized healthcare personnel access AI systems'
+            }
+        }
+    }
+
+
+def _load_gdpr_requirements() -> Dict[str, Any]:
+    """Load GDPR requirements"""
+    return {
+        'name': 'General Data Protection Regulation',
+        'requirements': {
+            'ART-6': {
+                'name': 'Lawful basis for processing',
+                'check_type': 'audit_trail',
+                'required_audit_fields': ('user_id', 'consent_status'),
+                'remediation': 'Document lawful basis for processing personal data'
+            },
+            'ART-32': {
+                'name': 'Security of processing',
+                'check_type': 'data_protection',
+                'no_sensitive_data': True,
+                'remediation': 'Implement appropriate security measures'
+            }
+        }
+    }
+
+
+def _load_sox_requirements() -> Dict[str, Any]:
+    """Load SOX requirements for financial AI"""
+    return {
+        'name': 'Sarbanes-Oxley Act',
+        'requirements': {
+            'SEC-302': {
+                'name': 'Corporate responsibility for financial reports',
+                'check_type': 'audit_trail',
+                'required_audit_fields': ('user_id', 'team_id', 'timestamp', 'purpose'),
+                'remediation': 'Maintain detailed audit trails for financial AI usage'
+            }
+        }
+    }
+
+
+def _load_iso27001_requirements() -> Dict[str, Any]:
+    """Load ISO 27001 requirements"""
+    return {
+        'name': 'ISO 27001 Information Security',
+        'requirements': {
+            'A-9-1-1': {
+                'name': 'Access control policy',
+                'check_type': 'access_control',
+                'required_role': 'authorized_user',
+                'remediation': 'Implement access control policies for AI systems'
+            },
+            'A-12-6-1': {
+                'name': 'Management of technical vulnerabilities',
+                'check_type': 'data_protection',
+                'no_sensitive_data': True,
+                'remediation': 'Address security vulnerabilities in AI systems'
+            }
+        }
+    }
 
 class AIComplianceFramework:
+    # Assessments retained for reporting; history may overshoot by TRIM_SLACK so
+    # the trim (a slice copy) runs once per TRIM_SLACK appends rather than on each
+    MAX_HISTORY = 10000
+    HISTORY_TRIM_SLACK = 1000
+    
+    # Per-framework verdicts remembered for repeated check inputs (LRU)
+    CHECK_CACHE_SIZE = 2048
+    
+    # Framework definitions are built and frozen once at import, shared by every instance
+    frameworks = _freeze({
+        'NIST_AI_RMF': _load_nist_framework(),
+        'EU_AI_ACT': _load_eu_ai_act(),
+        'HIPAA': _load_hipaa_requirements(),
+        'GDPR': _load_gdpr_requirements(),
+        'SOX': _load_sox_requirements(),
+        'ISO_27001': _load_iso27001_requirements()
+    })
+    
     def __init__(self):
-        self.frameworks = {
-            'NIST_AI_RMF': self._load_nist_framework(),
-            'EU_AI_ACT': self._load_eu_ai_act(),
-            'HIPAA': self._load_hipaa_requirements(),
-            'GDPR': self._load_gdpr_requirements(),
-            'SOX': self._load_sox_requirements(),
-            'ISO_27001': self._load_iso27001_requirements()
-        }
+        # Requirement checks resolved once per framework:
+        # (req_id, requirement, checker, recommendation to report on violation)
+        self._dispatch: Dict[str, List[Tuple[str, Dict[str, Any], Callable, Optional[Mapping[str, Any]]]]] = self._build_dispatch()
+        # Every audit field any requirement asks for, for check-input fingerprints
+        self._audit_fields = tuple(sorted({
+            field
+            for checks in self._dispatch.values()
+            for _, requirement, _, _ in checks
+            for field in requirement.get('required_audit_fields', ())
+        }))
+        self._check_cache: OrderedDict[tuple, Dict[str, Any]] = OrderedDict()
+        # Per framework, the inputs under which no requirement can be violated
+        self._pass_conditions = self._build_pass_conditions()
+        # One bit per (framework, requirement) so an assessment's violations pack into a uint64
+        self._requirement_bits: Dict[str, Dict[str, int]] = {}
+        bit_index = 0
+        for framework_name, checks in self._dispatch.items():
+            self._requirement_bits[framework_name] = {}
+            for req_id, _, _, _ in checks:
+                self._requirement_bits[framework_name][req_id] = 1 << bit_index
+                bit_index += 1
+        if bit_index > 64:
+            raise ValueError("Compliance violation bitmaps support at most 64 requirements")
         self.compliance_history = []
+        # Columns parallel to compliance_history, kept in timestamp order: POSIX timestamps so
+        # reports can bisect their date window, and violation bitmaps so they can aggregate it
+        # with NumPy instead of walking every assessment dict
+        self._history_timestamps: List[float] = []
+        self._history_violation_bits: List[int] = []
     
     async def assess_compliance(self, request_data: Dict[str, Any], 
                               response_data: Dict[str, Any],
@@ -22,8 +243,10 @@ class AIComplianceFramework:
                               user_context: Dict[str, Any]) -> Dict[str, Any]:
         """Assess compliance across all applicable frameworks"""
         
+        # One clock read feeds both the history index and the ISO timestamp
+        timestamp = time.time()
         assessment = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': local_isoformat(timestamp),
             'request_id': request_data.get('request_id'),
             'user_id': user_context.get('user_id'),
             'team_id': user_context.get('team_id'),
@@ -33,27 +256,61 @@ class AIComplianceFramework:
             'recommendations': []
         }
         
+        # Index threats by category once; every framework's checks read from it
+        threats_by_category: Dict[str, List[Dict[str, Any]]] = {}
+        for threat in security_scan.get('threats_detected', ()):
+            threats_by_category.setdefault(threat['category'], []).append(threat)
+        security_scan = {**security_scan, '_by_category': threats_by_category}
+        
+        # Check inputs shared by every framework
+        quality_score = quality_analysis.get('quality_score', 10)
+        has_sensitive_data = 'sensitive_data' in threats_by_category
+        role = user_context.get('role')
+        present_audit_fields = frozenset(
+            field for field in self._audit_fields
+            if (user_context[field] if field in user_context else request_data.get(field))
+        )
+        fingerprint = self._check_fingerprint(quality_analysis, security_scan, user_context, present_audit_fields)
+        
         # Assess each framework
+        violation_bits = 0
         for framework_name, framework_config in self.frameworks.items():
-            framework_result = await self._assess_framework_compliance(
-                framework_name, framework_config, request_data, response_data,
-                quality_analysis, security_scan, user_context
-            )
+            if self._passes_all_checks(framework_name, quality_score, has_sensitive_data, role, present_audit_fields):
+                framework_result = {
+                    'framework': framework_name,
+                    'compliant': True,
+                    'violations': [],
+                    'recommendations': [],
+                    'requirements_checked': len(framework_config.get('requirements', {}))
+                }
+            else:
+                framework_result = self._assess_framework_compliance(
+                    framework_name, framework_config, request_data, response_data,
+                    quality_analysis, security_scan, user_context, fingerprint
+                )
             
             assessment['frameworks'][framework_name] = framework_result
             
             if not framework_result['compliant']:
                 assessment['overall_compliance'] = False
                 assessment['violations'].extend(framework_result['violations'])
+                requirement_bits = self._requirement_bits[framework_name]
+                for violation in framework_result['violations']:
+                    violation_bits |= requirement_bits[violation['requirement_id']]
             
             assessment['recommendations'].extend(framework_result['recommendations'])
         
-        # Store assessment for audit trail
-        self.compliance_history.append(assessment)
+        # Store assessment for audit trail, in timestamp order (normally an append)
+        position = bisect_right(self._history_timestamps, timestamp)
+        self._history_timestamps.insert(position, timestamp)
+        self._history_violation_bits.insert(position, violation_bits)
+        self.compliance_history.insert(position, assessment)
         
-        # Keep only last 10,000 assessments for performance
-        if len(self.compliance_history) > 10000:
-            self.compliance_history = self.compliance_history[-10000:]
+        # Keep only the last MAX_HISTORY assessments, trimming in batches
+        if len(self.compliance_history) > self.MAX_HISTORY + self.HISTORY_TRIM_SLACK:
+            del self.compliance_history[:-self.MAX_HISTORY]
+            del self._history_timestamps[:-self.MAX_HISTORY]
+            del self._history_violation_bits[:-self.MAX_HISTORY]
         
         return assessment
     
@@ -63,27 +320,31 @@ class AIComplianceFramework:
                                        team_id: str = None) -> Dict[str, Any]:
         """Generate compliance report for specific framework and time period"""
         
-        # Filter assessments by criteria
-        filtered_assessments = [
-            assessment for assessment in self.compliance_history
-            if (start_date <= datetime.fromisoformat(assessment['timestamp']) <= end_date and
-                (not team_id or assessment.get('team_id') == team_id))
-        ]
-        
         if framework not in self.frameworks:
             return {'error': f'Unknown framework: {framework}'}
         
-        # Analyze compliance data
-        total_assessments = len(filtered_assessments)
-        compliant_assessments = len([a for a in filtered_assessments 
-                                   if a['frameworks'].get(framework, {}).get('compliant', False)])
+        # Filter assessments by criteria: bisect the date window, then filter by team within it
+        low = bisect_left(self._history_timestamps, start_date.timestamp())
+        high = bisect_right(self._history_timestamps, end_date.timestamp())
+        violation_bits = np.array(self._history_violation_bits[low:high], dtype=np.uint64)
+        if team_id:
+            team_mask = np.fromiter(
+                (assessment.get('team_id') == team_id for assessment in self.compliance_history[low:high]),
+                dtype=bool, count=high - low
+            )
+            violation_bits = violation_bits[team_mask]
+        
+        # Analyze compliance data: a framework is compliant when none of its requirement bits are set
+        requirement_bits = self._requirement_bits[framework]
+        framework_mask = np.uint64(sum(requirement_bits.values()))
+        total_assessments = len(violation_bits)
+        compliant_assessments = int(np.count_nonzero((violation_bits & framework_mask) == 0))
         
         violation_counts = {}
-        for assessment in filtered_assessments:
-            framework_data = assessment['frameworks'].get(framework, {})
-            for violation in framework_data.get('violations', []):
-                violation_type = violation.get('requirement_id', 'unknown')
-                violation_counts[violation_type] = violation_counts.get(violation_type, 0) + 1
+        for req_id, bit in requirement_bits.items():
+            count = int(np.count_nonzero(violation_bits & np.uint64(bit)))
+            if count:
+                violation_counts[req_id] = count
         
         report = {
             'framework': framework,
@@ -104,15 +365,107 @@ class AIComplianceFramework:
         
         return report
     
-    async def _assess_framework_compliance(self, framework_name: str,
-                                         framework_config: Dict[str, Any],
-                                         request_data: Dict[str, Any],
-                                         response_data: Dict[str, Any],
-                                         quality_analysis: Dict[str, Any],
-                                         security_scan: Dict[str, Any],
-                                         user_context: Dict[str, Any]) -> Dict[str, Any]:
+    def _build_dispatch(self) -> Dict[str, List[Tuple[str, Dict[str, Any], Callable, Optional[Mapping[str, Any]]]]]:
+        """Bind every framework requirement to its check method"""
+        checkers = {
+            'data_protection': self._check_data_protection,
+            'quality_assurance': self._check_quality_assurance,
+            'audit_trail': self._check_audit_trail,
+            'access_control': self._check_access_control,
+            'transparency': self._check_transparency
+        }
+        
+        dispatch = {}
+        for framework_name, framework_config in self.frameworks.items():
+            dispatch[framework_name] = [
+                (req_id, requirement, checkers[requirement['check_type']], self._recommendation_for(req_id, requirement))
+                for req_id, requirement in framework_config.get('requirements', {}).items()
+                if requirement.get('check_type') in checkers
+            ]
+        return dispatch
+    
+    def _recommendation_for(self, req_id: str, requirement: Dict[str, Any]) -> Optional[Mapping[str, Any]]:
+        """Read-only template of the recommendation reported whenever the requirement is violated"""
+        if not requirement.get('remediation'):
+            return None
+        return MappingProxyType({
+            'requirement_id': req_id,
+            'remediation': requirement['remediation'],
+            'priority': requirement.get('priority', 'medium')
+        })
+    
+    def _build_pass_conditions(self) -> Dict[str, Tuple[Optional[float], frozenset, frozenset, bool]]:
+        """Per framework: (highest min quality score, audit fields, required roles, forbids sensitive data)"""
+        conditions = {}
+        for framework_name, checks in self._dispatch.items():
+            quality_thresholds = [
+                requirement.get('min_quality_score', 0)
+                for _, requirement, _, _ in checks if requirement['check_type'] == 'quality_assurance'
+            ]
+            conditions[framework_name] = (
+                max(quality_thresholds) if quality_thresholds else None,
+                frozenset(
+                    field for _, requirement, _, _ in checks if requirement['check_type'] == 'audit_trail'
+                    for field in requirement.get('required_audit_fields', ())
+                ),
+                frozenset(
+                    requirement['required_role'] for _, requirement, _, _ in checks
+                    if requirement['check_type'] == 'access_control' and requirement.get('required_role')
+                ),
+                any(
+                    requirement['check_type'] == 'data_protection' and requirement.get('no_sensitive_data', False)
+                    for _, requirement, _, _ in checks
+                )
+            )
+        return conditions
+    
+    def _passes_all_checks(self, framework_name: str, quality_score: Any, has_sensitive_data: bool,
+                           role: Optional[str], present_audit_fields: frozenset) -> bool:
+        """Whether the framework is certainly compliant, without running its requirement checks"""
+        min_quality_score, audit_fields, required_roles, forbids_sensitive_data = self._pass_conditions[framework_name]
+        return (
+            not (forbids_sensitive_data and has_sensitive_data)
+            and (min_quality_score is None or quality_score >= min_quality_score)
+            and audit_fields <= present_audit_fields
+            and all(role == required_role for required_role in required_roles)
+        )
+    
+    def _check_fingerprint(self, quality_analysis: Dict[str, Any],
+                           security_scan: Dict[str, Any],
+                           user_context: Dict[str, Any],
+                           present_audit_fields: frozenset) -> Optional[tuple]:
+        """Everything the requirement checks read, or None if it can't be used as a cache key"""
+        fingerprint = (
+            quality_analysis.get('quality_score', 10),
+            quality_analysis.get('hallucination_risk'),
+            tuple(t['type'] for t in security_scan.get('_by_category', {}).get('sensitive_data', ())),
+            user_context.get('role'),
+            present_audit_fields
+        )
+        try:
+            hash(fingerprint)
+        except TypeError:
+            return None
+        return fingerprint
+    
+    def _assess_framework_compliance(self, framework_name: str,
+                                     framework_config: Dict[str, Any],
+                                     request_data: Dict[str, Any],
+                                     response_data: Dict[str, Any],
+                                     quality_analysis: Dict[str, Any],
+                                     security_scan: Dict[str, Any],
+                                     user_context: Dict[str, Any],
+                                     fingerprint: Optional[tuple] = None) -> Dict[str, Any]:
         """Assess compliance for a specific framework"""
         
+        # Identical check inputs always produce the same verdict
+        if fingerprint is not None:
+            cache_key = (framework_name, fingerprint)
+            cached = self._check_cache.get(cache_key)
+            if cached is not None:
+                self._check_cache.move_to_end(cache_key)
+                return _copy_verdict(cached)
+        
         result = {
             'framework': framework_name,
             'compliant': True,
@@ -121,10 +474,8 @@ class AIComplianceFramework:
             'requirements_checked': len(framework_config.get('requirements', {}))
         }
         
-        requirements = framework_config.get('requirements', {})
-        
-        for req_id, requirement in requirements.items():
-            violation = await self._check_requirement_compliance(
+        for req_id, requirement, checker, recommendation in self._dispatch[framework_name]:
+            violation = checker(
                 req_id, requirement, request_data, response_data,
                 quality_analysis, security_scan, user_context
             )
@@ -134,48 +485,30 @@ class AIComplianceFramework:
                 result['violations'].append(violation)
                 
                 # Add specific recommendations
-                if requirement.get('remediation'):
-                    result['recommendations'].append({
-                        'requirement_id': req_id,
-                        'remediation': requirement['remediation'],
-                        'priority': requirement.get('priority', 'medium')
-                    })
+                if recommendation is not None:
+                    result['recommendations'].append(dict(recommendation))
         
-        return result
-    
-    async def _check_requirement_compliance(self, req_id: str, requirement: Dict[str, Any],
-                                          request_data: Dict[str, Any],
-                                          response_data: Dict[str, Any],
-                                          quality_analysis: Dict[str, Any],
-                                          security_scan: Dict[str, Any],
-                                          user_context: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Check compliance for a specific requirement"""
-        
-        check_type = requirement.get('check_type')
-        
-        if check_type == 'data_protection':
-            return await self._check_data_protection(req_id, requirement, request_data, security_scan)
-        elif check_type == 'quality_assurance':
-            return await self._check_quality_assurance(req_id, requirement, quality_analysis)
-        elif check_type == 'audit_trail':
-            return await self._check_audit_trail(req_id, requirement, request_data, user_context)
-        elif check_type == 'access_control':
-            return await self._check_access_control(req_id, requirement, user_context)
-        elif check_type == 'transparency':
-            return await self._check_transparency(req_id, requirement, request_data, response_data)
+        if fingerprint is not None:
+            self._check_cache[cache_key] = _copy_verdict(result)
+            if len(self._check_cache) > self.CHECK_CACHE_SIZE:
+                self._check_cache.popitem(last=False)
         
-        return None
+        return result
     
-    async def _check_data_protection(self, req_id: str, requirement: Dict[str, Any],
-                                   request_data: Dict[str, Any],
-                                   security_scan: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _check_data_protection(self, req_id: str, requirement: Dict[str, Any],
+                               request_data: Dict[str, Any],
+                               response_data: Dict[str, Any],
+                               quality_analysis: Dict[str, Any],
+                               security_scan: Dict[str, Any],
+                               user_context: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Check data protection compliance"""
         
-        # Check for sensitive data in request
-        sensitive_threats = [t for t in security_scan.get('threats_detected', []) 
-                           if t['category'] == 'sensitive_data']
+        if not requirement.get('no_sensitive_data', False):
+            return None
         
-        if sensitive_threats and requirement.get('no_sensitive_data', False):
+        # Check for sensitive data in request (threats pre-indexed by assess_compliance)
+        sensitive_threats = security_scan.get('_by_category', {}).get('sensitive_data')
+        if sensitive_threats:
             return {
                 'requirement_id': req_id,
                 'requirement_name': requirement['name'],
@@ -187,8 +520,12 @@ class AIComplianceFramework:
         
         return None
     
-    async def _check_quality_assurance(self, req_id: str, requirement: Dict[str, Any],
-                                     quality_analysis: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _check_quality_assurance(self, req_id: str, requirement: Dict[str, Any],
+                                 request_data: Dict[str, Any],
+                                 response_data: Dict[str, Any],
+                                 quality_analysis: Dict[str, Any],
+                                 security_scan: Dict[str, Any],
+                                 user_context: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Check quality assurance compliance"""
         
         min_quality_score = requirement.get('min_quality_score', 0)
@@ -210,19 +547,20 @@ class AIComplianceFramework:
         
         return None
     
-    async def _check_audit_trail(self, req_id: str, requirement: Dict[str, Any],
-                               request_data: Dict[str, Any],
-                               user_context: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _check_audit_trail(self, req_id: str, requirement: Dict[str, Any],
+                           request_data: Dict[str, Any],
+                           response_data: Dict[str, Any],
+                           quality_analysis: Dict[str, Any],
+                           security_scan: Dict[str, Any],
+                           user_context: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Check audit trail compliance"""
         
-        required_fields = requirement.get('required_audit_fields', [])
-        missing_fields = []
-        
-        audit_data = {**request_data, **user_context}
-        
-        for field in required_fields:
-            if field not in audit_data or not audit_data[field]:
-                missing_fields.append(field)
+        # Probe both sources directly rather than merging them; user_context wins
+        # over request_data for fields present in both, as a merge would
+        missing_fields = [
+            field for field in requirement.get('required_audit_fields', ())
+            if not (user_context[field] if field in user_context else request_data.get(field))
+        ]
         
         if missing_fields:
             return {
@@ -236,8 +574,12 @@ class AIComplianceFramework:
         
         return None
     
-    async def _check_access_control(self, req_id: str, requirement: Dict[str, Any],
-                                  user_context: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _check_access_control(self, req_id: str, requirement: Dict[str, Any],
+                              request_data: Dict[str, Any],
+                              response_data: Dict[str, Any],
+                              quality_analysis: Dict[str, Any],
+                              security_scan: Dict[str, Any],
+                              user_context: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Check access control compliance"""
         
         required_role = requirement.get('required_role')
@@ -258,9 +600,12 @@ class AIComplianceFramework:
         
         return None
     
-    async def _check_transparency(self, req_id: str, requirement: Dict[str, Any],
-                                request_data: Dict[str, Any],
-                                response_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _check_transparency(self, req_id: str, requirement: Dict[str, Any],
+                            request_data: Dict[str, Any],
+                            response_data: Dict[str, Any],
+                            quality_analysis: Dict[str, Any],
+                            security_scan: Dict[str, Any],
+                            user_context: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Check transparency compliance"""
         
         # Check if AI involvement is disclosed
@@ -297,146 +642,6 @@ class AIComplianceFramework:
             })
         
         return recommendations
-    
-    def _load_nist_framework(self) -> Dict[str, Any]:
-        """Load NIST AI Risk Management Framework requirements"""
-        return {
-            'name': 'NIST AI Risk Management Framework',
-            'version': '1.0',
-            'requirements': {
-                'GOVERN-1.1': {
-                    'name': 'AI governance processes',
-                    'check_type': 'audit_trail',
-                    'required_audit_fields': ['user_id', 'team_id', 'timestamp'],
-                    'remediation': 'Ensure all AI requests include proper user identification and timestamps'
-                },
-                'MAP-1.1': {
-                    'name': 'AI system documentation',
-                    'check_type': 'audit_trail',
-                    'required_audit_fields': ['model', 'provider'],
-                    'remediation': 'Document AI model and provider information for all requests'
-                },
-                'MEASURE-2.1': {
-                    'name': 'AI system performance monitoring',
-                    'check_type': 'quality_assurance',
-                    'min_quality_score': 7.0,
-                    'remediation': 'Implement quality monitoring to maintain minimum performance standards'
-                },
-                'MANAGE-1.1': {
-                    'name': 'Risk management processes',
-                    'check_type': 'data_protection',
-                    'no_sensitive_data': True,
-                    'remediation': 'Implement data scanning to prevent sensitive data exposure'
-                }
-            }
-        }
-    
-    def _load_eu_ai_act(self) -> Dict[str, Any]:
-        """Load EU AI Act requirements"""
-        return {
-            'name': 'EU AI Act',
-            'version': '2024',
-            'requirements': {
-                'ART-9': {
-                    'name': 'Risk management system',
-                    'check_type': 'quality_assurance',
-                    'min_quality_score': 8.0,
-                    'remediation': 'Maintain high quality standards for AI systems'
-                },
-                'ART-10': {
-                    'name': 'Data and data governance',
-                    'check_type': 'data_protection',
-                    'no_sensitive_data': True,
-                    'remediation': 'Implement comprehensive data protection measures'
-                },
-                'ART-12': {
-                    'name': 'Record-keeping',
-                    'check_type': 'audit_trail',
-                    'required_audit_fields': ['user_id', 'timestamp', 'model', 'provider'],
-                    'remediation': 'Maintain detailed records of AI system operations'
-                },
-                'ART-13': {
-                    'name': 'Transparency and provision of information',
-                    'check_type': 'transparency',
-                    'disclose_ai_involvement': True,
-                    'remediation': 'Ensure users are informed about AI system involvement'
-                }
-            }
-        }
-    
-    def _load_hipaa_requirements(self) -> Dict[str, Any]:
-        """Load HIPAA requirements for healthcare AI"""
-        return {
-            'name': 'HIPAA Privacy and Security Rules',
-            'requirements': {
-                'PRIVACY-RULE': {
-                    'name': 'Protected Health Information',
-                    'check_type': 'data_protection',
-                    'no_sensitive_data': True,
-                    'remediation': 'Prevent PHI from being processed by AI systems'
-                },
-                'SECURITY-RULE': {
-                    'name': 'Administrative Safeguards',
-                    'check_type': 'access_control',
-                    'required_role': 'healthcare_authorized',
-                    'remediation': 'Ensure only authorized healthcare personnel access AI systems'
-                }
-            }
-        }
-    
-    def _load_gdpr_requirements(self) -> Dict[str, Any]:
-        """Load GDPR requirements"""
-        return {
-            'name': 'General Data Protection Regulation',
-            'requirements': {
-                'ART-6': {
-                    'name': 'Lawful basis for processing',
-                    'check_type': 'audit_trail',
-                    'required_audit_fields': ['user_id', 'consent_status'],
-                    'remediation': 'Document lawful basis for processing personal data'
-                },
-                'ART-32': {
-                    'name': 'Security of processing',
-                    'check_type': 'data_protection',
-                    'no_sensitive_data': True,
-                    'remediation': 'Implement appropriate security measures'
-                }
-            }
-        }
-    
-    def _load_sox_requirements(self) -> Dict[str, Any]:
-        """Load SOX requirements for financial AI"""
-        return {
-            'name': 'Sarbanes-Oxley Act',
-            'requirements': {
-                'SEC-302': {
-                    'name': 'Corporate responsibility for financial reports',
-                    'check_type': 'audit_trail',
-                    'required_audit_fields': ['user_id', 'team_id', 'timestamp', 'purpose'],
-                    'remediation': 'Maintain detailed audit trails for financial AI usage'
-                }
-            }
-        }
-    
-    def _load_iso27001_requirements(self) -> Dict[str, Any]:
-        """Load ISO 27001 requirements"""
-        return {
-            'name': 'ISO 27001 Information Security',
-            'requirements': {
-                'A-9-1-1': {
-                    'name': 'Access control policy',
-                    'check_type': 'access_control',
-                    'required_role': 'authorized_user',
-                    'remediation': 'Implement access control policies for AI systems'
-                },
-                'A-12-6-1': {
-                    'name': 'Management of technical vulnerabilities',
-                    'check_type': 'data_protection',
-                    'no_sensitive_data': True,
-                    'remediation': 'Address security vulnerabilities in AI systems'
-                }
-            }
-        }
 
 # Create singleton instance
 compliance_framework = AIComplianceFramework()
\ No newline at end of file
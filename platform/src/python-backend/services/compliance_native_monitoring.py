@@ -1,12 +1,17 @@
 # services/compliance_native_monitoring.py
 import asyncio
-import json
+import bisect
+from collections import Counter, OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Mapping, NamedTuple, Optional, Tuple
 from enum import Enum
+from types import MappingProxyType
 import hashlib
+import json
+import time
+import orjson
 
-class ComplianceFramework(Enum):
+class ComplianceFramework(str, Enum):
     NIST_AI_RMF = "nist_ai_rmf"
     EU_AI_ACT = "eu_ai_act"
     HIPAA = "hipaa"
@@ -15,232 +20,477 @@ class ComplianceFramework(Enum):
     GDPR = "gdpr"
     SOX = "sox"
 
-class RiskLevel(Enum):
+class RiskLevel(str, Enum):
     LOW = "low"
     MEDIUM = "medium"
     HIGH = "high"
     CRITICAL = "critical"
 
-class ComplianceNativeMonitor:
-    def __init__(self):
-        self.frameworks = {
-            ComplianceFramework.NIST_AI_RMF: self._init_nist_framework(),
-            ComplianceFramework.EU_AI_ACT: self._init_eu_ai_act_framework(),
-            ComplianceFramework.HIPAA: self._init_hipaa_framework(),
-            ComplianceFramework.SECTION_1557: self._init_section_1557_framework(),
-            ComplianceFramework.FINANCIAL_BIAS: self._init_financial_bias_framework(),
-            ComplianceFramework.GDPR: self._init_gdpr_framework(),
-            ComplianceFramework.SOX: self._init_sox_framework()
-        }
-        
-    def _init_nist_framework(self) -> Dict[str, Any]:
-        """Initialize NIST AI Risk Management Framework"""
-        return {
-            "name": "NIST AI Risk Management Framework",
-            "version": "1.0",
-            "categories": {
-                "govern": {
-                    "name": "Govern",
-                    "controls": {
-                        "AI_GO_1": "Establish AI governance structure",
-                        "AI_GO_2": "Define AI risk management roles",
-                        "AI_GO_3": "Establish AI risk tolerance",
-                        "AI_GO_4": "Document AI system inventory"
-                    }
-                },
-                "map": {
-                    "name": "Map",
-                    "controls": {
-                        "AI_MA_1": "Identify AI system context",
-                        "AI_MA_2": "Identify AI system components",
-                        "AI_MA_3": "Identify AI system interactions",
-                        "AI_MA_4": "Identify AI system boundaries"
-                    }
-                },
-                "measure": {
-                    "name": "Measure",
-                    "controls": {
-                        "AI_ME_1": "Measure AI system performance",
-                        "AI_ME_2": "Measure AI system accuracy",
-                        "AI_ME_3": "Measure AI system bias",
-                        "AI_ME_4": "Measure AI system security"
-                    }
-                },
-                "manage": {
-                    "name": "Manage",
-                    "controls": {
-                        "AI_MG_1": "Manage AI system risks",
-                        "AI_MG_2": "Manage AI system changes",
-                        "AI_MG_3": "Manage AI system incidents",
-                        "AI_MG_4": "Manage AI system lifecycle"
-                    }
-                }
+# Compliance score band boundaries and the (risk level, status) of each band, lowest first
+_RISK_THRESHOLDS = (0.5, 0.7, 0.9)
+_RISK_OUTCOMES = (
+    (RiskLevel.CRITICAL, "non_compliant"),
+    (RiskLevel.HIGH, "partially_compliant"),
+    (RiskLevel.MEDIUM, "mostly_compliant"),
+    (RiskLevel.LOW, "compliant")
+)
+
+def _score_to_risk(score: float) -> Tuple[RiskLevel, str]:
+    """Map a compliance score to its risk level and status"""
+    return _RISK_OUTCOMES[bisect.bisect_right(_RISK_THRESHOLDS, score)]
+
+# NIST AI Risk Management Framework
+_NIST_FRAMEWORK = MappingProxyType({
+    "name": "NIST AI Risk Management Framework",
+    "version": "1.0",
+    "categories": {
+        "govern": {
+            "name": "Govern",
+            "controls": {
+                "AI_GO_1": "Establish AI governance structure",
+                "AI_GO_2": "Define AI risk management roles",
+                "AI_GO_3": "Establish AI risk tolerance",
+                "AI_GO_4": "Document AI system inventory"
             }
-        }
-    
-    def _init_eu_ai_act_framework(self) -> Dict[str, Any]:
-        """Initialize EU AI Act compliance framework"""
-        return {
-            "name": "EU AI Act",
-            "version": "2024",
-            "risk_categories": {
-                "unacceptable_risk": {
-                    "name": "Unacceptable Risk",
-                    "prohibited": True,
-                    "examples": ["Social scoring", "Manipulative AI", "Exploitative AI"]
-                },
-                "high_risk": {
-                    "name": "High Risk",
-                    "requirements": [
-                        "Risk management system",
-                        "Data governance",
-                        "Technical documentation",
-                        "Record keeping",
-                        "Transparency and provision of information",
-                        "Human oversight",
-                        "Accuracy, robustness and cybersecurity"
-                    ]
-                },
-                "limited_risk": {
-                    "name": "Limited Risk",
-                    "requirements": ["Transparency obligations"]
-                },
-                "minimal_risk": {
-                    "name": "Minimal Risk",
-                    "requirements": ["No specific requirements"]
-                }
+        },
+        "map": {
+            "name": "Map",
+            "controls": {
+                "AI_MA_1": "Identify AI system context",
+                "AI_MA_2": "Identify AI system components",
+                "AI_MA_3": "Identify AI system interactions",
+                "AI_MA_4": "Identify AI system boundaries"
+            }
+        },
+        "measure": {
+            "name": "Measure",
+            "controls": {
+                "AI_ME_1": "Measure AI system performance",
+                "AI_ME_2": "Measure AI system accuracy",
+                "AI_ME_3": "Measure AI system bias",
+                "AI_ME_4": "Measure AI system security"
+            }
+        },
+        "manage": {
+            "name": "Manage",
+            "controls": {
+                "AI_MG_1": "Manage AI system risks",
+                "AI_MG_2": "Manage AI system changes",
+                "AI_MG_3": "Manage AI system incidents",
+                "AI_MG_4": "Manage AI system lifecycle"
             }
         }
-    
-    def _init_hipaa_framework(self) -> Dict[str, Any]:
-        """Initialize HIPAA compliance framework"""
-        return {
-            "name": "HIPAA (Health Insurance Portability and Accountability Act)",
-            "version": "2023",
-            "safeguards": {
-                "administrative": [
-                    "Security Officer designation",
-                    "Workforce training",
-                    "Access management",
-                    "Information access management",
-                    "Security awareness training"
-                ],
-                "physical": [
-                    "Facility access controls",
-                    "Workstation use restrictions",
-                    "Device and media controls"
-                ],
-                "technical": [
-                    "Access control",
-                    "Audit controls",
-                    "Integrity controls",
-                    "Transmission security"
-                ]
-            },
-            "ai_specific_requirements": [
-                "PHI data minimization in AI training",
-                "AI model audit trails",
-                "Patient consent for AI processing",
-                "AI decision explainability",
-                "Data breach notification for AI incidents"
-            ]
-        }
-    
-    def _init_section_1557_framework(self) -> Dict[str, Any]:
-        """Initialize Section 1557 (Nondiscrimination) framework"""
-        return {
-            "name": "Section 1557 - Nondiscrimination in Health Programs",
-            "version": "2024",
-            "protected_classes": [
-                "Race", "Color", "National Origin", "Sex", "Age", "Disability"
-            ],
-            "ai_requirements": [
-                "Bias testing for protected classes",
-                "Fairness metrics monitoring",
-                "Disparate impact analysis",
-                "Accessibility compliance",
-                "Language access requirements",
-                "Cultural competency in AI decisions"
-            ],
-            "monitoring_requirements": [
-                "Regular bias audits",
-                "Outcome monitoring by protected class",
-                "Accessibility testing",
-                "Language barrier identification"
-            ]
-        }
-    
-    def _init_financial_bias_framework(self) -> Dict[str, Any]:
-        """Initialize Financial Services bias detection framework"""
-        return {
-            "name": "Financial Services AI Bias Framework",
-            "regulations": ["ECOA", "Fair Lending", "CFPB Guidelines"],
-            "protected_classes": [
-                "Race", "Color", "Religion", "National Origin", "Sex", 
-                "Marital Status", "Age", "Income Source", "Disability"
-            ],
-            "monitoring_requirements": [
-                "Adverse action monitoring",
-                "Fair lending analysis",
-                "Disparate impact testing",
-                "Model bias validation",
-                "Outcome monitoring by protected class"
-            ],
-            "metrics": [
-                "Approval rate disparities",
-                "Interest rate disparities",
-                "Credit limit disparities",
-                "Default rate disparities"
+    }
+})
+
+# EU AI Act compliance framework
+_EU_AI_ACT_FRAMEWORK = MappingProxyType({
+    "name": "EU AI Act",
+    "version": "2024",
+    "risk_categories": {
+        "unacceptable_risk": {
+            "name": "Unacceptable Risk",
+            "prohibited": True,
+            "examples": ["Social scoring", "Manipulative AI", "Exploitative AI"]
+        },
+        "high_risk": {
+            "name": "High Risk",
+            "requirements": [
+                "Risk management system",
+                "Data governance",
+                "Technical documentation",
+                "Record keeping",
+                "Transparency and provision of information",
+                "Human oversight",
+                "Accuracy, robustness and cybersecurity"
             ]
+        },
+        "limited_risk": {
+            "name": "Limited Risk",
+            "requirements": ["Transparency obligations"]
+        },
+        "minimal_risk": {
+            "name": "Minimal Risk",
+            "requirements": ["No specific requirements"]
         }
+    }
+})
+
+# HIPAA compliance framework
+_HIPAA_FRAMEWORK = MappingProxyType({
+    "name": "HIPAA (Health Insurance Portability and Accountability Act)",
+    "version": "2023",
+    "safeguards": {
+        "administrative": [
+            "Security Officer designation",
+            "Workforce training",
+            "Access management",
+            "Information access management",
+            "Security awareness training"
+        ],
+        "physical": [
+            "Facility access controls",
+            "Workstation use restrictions",
+            "Device and media controls"
+        ],
+        "technical": [
+            "Access control",
+            "Audit controls",
+            "Integrity controls",
+            "Transmission security"
+        ]
+    },
+    "ai_specific_requirements": [
+        "PHI data minimization in AI training",
+        "AI model audit trails",
+        "Patient consent for AI processing",
+        "AI decision explainability",
+        "Data breach notification for AI incidents"
+    ]
+})
+
+# Section 1557 (Nondiscrimination) framework
+_SECTION_1557_FRAMEWORK = MappingProxyType({
+    "name": "Section 1557 - Nondiscrimination in Health Programs",
+    "version": "2024",
+    "protected_classes": [
+        "Race", "Color", "National Origin", "Sex", "Age", "Disability"
+    ],
+    "ai_requirements": [
+        "Bias testing for protected classes",
+        "Fairness metrics monitoring",
+        "Disparate impact analysis",
+        "Accessibility compliance",
+        "Language access requirements",
+        "Cultural competency in AI decisions"
+    ],
+    "monitoring_requirements": [
+        "Regular bias audits",
+        "Outcome monitoring by protected class",
+        "Accessibility testing",
+        "Language barrier identification"
+    ]
+})
+
+# Financial Services bias detection framework
+_FINANCIAL_BIAS_FRAMEWORK = MappingProxyType({
+    "name": "Financial Services AI Bias Framework",
+    "regulations": ["ECOA", "Fair Lending", "CFPB Guidelines"],
+    "protected_classes": [
+        "Race", "Color", "Religion", "National Origin", "Sex", 
+        "Marital Status", "Age", "Income Source", "Disability"
+    ],
+    "monitoring_requirements": [
+        "Adverse action monitoring",
+        "Fair lending analysis",
+        "Disparate impact testing",
+        "Model bias validation",
+        "Outcome monitoring by protected class"
+    ],
+    "metrics": [
+        "Approval rate disparities",
+        "Interest rate disparities",
+        "Credit limit disparities",
+        "Default rate disparities"
+    ]
+})
+
+# GDPR compliance framework
+_GDPR_FRAMEWORK = MappingProxyType({
+    "name": "General Data Protection Regulation (GDPR)",
+    "version": "2018",
+    "principles": [
+        "Lawfulness, fairness and transparency",
+        "Purpose limitation",
+        "Data minimization",
+        "Accuracy",
+        "Storage limitation",
+        "Integrity and confidentiality",
+        "Accountability"
+    ],
+    "ai_specific_requirements": [
+        "Automated decision-making transparency",
+        "Right to explanation",
+        "Data protection by design",
+        "Privacy impact assessments",
+        "Consent management",
+        "Data portability",
+        "Right to erasure"
+    ]
+})
+
+# SOX compliance framework
+_SOX_FRAMEWORK = MappingProxyType({
+    "name": "Sarbanes-Oxley Act (SOX)",
+    "version": "2002",
+    "requirements": [
+        "Internal controls over financial reporting",
+        "Management assessment of controls",
+        "Auditor attestation",
+        "Disclosure controls and procedures",
+        "Code of ethics",
+        "Whistleblower protection"
+    ],
+    "ai_specific_requirements": [
+        "AI system controls documentation",
+        "AI decision audit trails",
+        "AI model validation",
+        "AI risk assessment",
+        "AI incident reporting",
+        "AI governance oversight"
+    ]
+})
+
+_FRAMEWORKS = MappingProxyType({
+    ComplianceFramework.NIST_AI_RMF: _NIST_FRAMEWORK,
+    ComplianceFramework.EU_AI_ACT: _EU_AI_ACT_FRAMEWORK,
+    ComplianceFramework.HIPAA: _HIPAA_FRAMEWORK,
+    ComplianceFramework.SECTION_1557: _SECTION_1557_FRAMEWORK,
+    ComplianceFramework.FINANCIAL_BIAS: _FINANCIAL_BIAS_FRAMEWORK,
+    ComplianceFramework.GDPR: _GDPR_FRAMEWORK,
+    ComplianceFramework.SOX: _SOX_FRAMEWORK
+})
+
+class Evidence(NamedTuple):
+    """Immutable evidence record for one assessed control; converted to a dict when returned"""
+    control: str
+    status: str
+    evidence: str
+
+def _prebuild_evidence(controls: tuple) -> tuple:
+    """Swap a control table's evidence strings for the evidence records they always produce"""
+    return tuple(
+        (control_id, data_key, finding, violation, recommendation,
+         # Compliant evidence with a "{}" placeholder embeds the documented value, so it stays a template
+         compliant_evidence if "{}" in compliant_evidence
+         else Evidence(control_id, "compliant", compliant_evidence),
+         Evidence(control_id, "non_compliant", missing_evidence))
+        for control_id, data_key, finding, violation, recommendation, compliant_evidence, missing_evidence in controls
+    )
+
+def _control_evidence(control: tuple, value: Any) -> Evidence:
+    """Evidence record for a control given its documented value"""
+    if not value:
+        return control[6]
+    if isinstance(control[5], str):
+        return Evidence(control[0], "compliant", control[5].format(value))
+    return control[5]
+
+# Controls are assessed by presence of a documented data key; each row is
+# (control_id, data_key, finding, violation, recommendation, compliant evidence, non-compliant evidence)
+
+# NIST AI RMF controls, by category
+_GOVERN_CONTROLS = _prebuild_evidence((
+    ("AI_GO_1", "governance_structure",
+     "AI governance structure is established",
+     "Missing AI governance structure",
+     "Establish formal AI governance structure with defined roles and responsibilities",
+     "Governance structure documented", "No governance structure found"),
+    ("AI_GO_2", "risk_management_roles",
+     "AI risk management roles are defined",
+     "Missing AI risk management roles",
+     "Define clear AI risk management roles and responsibilities",
+     "Risk management roles documented", "No risk management roles found"),
+    ("AI_GO_3", "risk_tolerance",
+     "AI risk tolerance is established",
+     "Missing AI risk tolerance definition",
+     "Establish clear AI risk tolerance levels and thresholds",
+     "Risk tolerance documented", "No risk tolerance found"),
+    ("AI_GO_4", "system_inventory",
+     "AI system inventory is documented",
+     "Missing AI system inventory",
+     "Maintain comprehensive AI system inventory with regular updates",
+     "System inventory documented", "No system inventory found"),
+))
+
+_MAP_CONTROLS = _prebuild_evidence((
+    ("AI_MA_1", "system_context",
+     "AI system context is identified",
+     "Missing AI system context identification",
+     "Document AI system context including purpose, scope, and environment",
+     "System context documented", "No system context found"),
+    ("AI_MA_2", "system_components",
+     "AI system components are identified",
+     "Missing AI system components identification",
+     "Document all AI system components including models, data, and infrastructure",
+     "System components documented", "No system components found"),
+    ("AI_MA_3", "system_interactions",
+     "AI system interactions are identified",
+     "Missing AI system interactions identification",
+     "Document AI system interactions with external systems and users",
+     "System interactions documented", "No system interactions found"),
+    ("AI_MA_4", "system_boundaries",
+     "AI system boundaries are identified",
+     "Missing AI system boundaries identification",
+     "Define clear AI system boundaries and interfaces",
+     "System boundaries documented", "No system boundaries found"),
+))
+
+_MEASURE_CONTROLS = _prebuild_evidence((
+    ("AI_ME_1", "performance_metrics",
+     "AI system performance is measured",
+     "Missing AI system performance measurement",
+     "Implement comprehensive AI system performance monitoring",
+     "Performance metrics documented", "No performance metrics found"),
+    ("AI_ME_2", "accuracy_metrics",
+     "AI system accuracy is measured",
+     "Missing AI system accuracy measurement",
+     "Implement AI system accuracy monitoring and validation",
+     "Accuracy metrics documented", "No accuracy metrics found"),
+    ("AI_ME_3", "bias_metrics",
+     "AI system bias is measured",
+     "Missing AI system bias measurement",
+     "Implement AI system bias monitoring and testing",
+     "Bias metrics documented", "No bias metrics found"),
+    ("AI_ME_4", "security_metrics",
+     "AI system security is measured",
+     "Missing AI system security measurement",
+     "Implement AI system security monitoring and testing",
+     "Security metrics documented", "No security metrics found"),
+))
+
+_MANAGE_CONTROLS = _prebuild_evidence((
+    ("AI_MG_1", "risk_management",
+     "AI system risks are managed",
+     "Missing AI system risk management",
+     "Implement comprehensive AI system risk management processes",
+     "Risk management documented", "No risk management found"),
+    ("AI_MG_2", "change_management",
+     "AI system changes are managed",
+     "Missing AI system change management",
+     "Implement AI system change management processes",
+     "Change management documented", "No change management found"),
+    ("AI_MG_3", "incident_management",
+     "AI system incidents are managed",
+     "Missing AI system incident management",
+     "Implement AI system incident management processes",
+     "Incident management documented", "No incident management found"),
+    ("AI_MG_4", "lifecycle_management",
+     "AI system lifecycle is managed",
+     "Missing AI system lifecycle management",
+     "Implement AI system lifecycle management processes",
+     "Lifecycle management documented", "No lifecycle management found"),
+))
+
+# EU AI Act controls
+_EU_AI_ACT_CONTROLS = _prebuild_evidence((
+    ("EU_AI_ACT_1", "risk_classification",
+     "AI system risk classification is documented",
+     "Missing AI system risk classification",
+     "Classify AI system risk level according to EU AI Act Annexes",
+     "Classified as {}", "No risk classification found"),
+    ("EU_AI_ACT_2", "data_governance",
+     "Data governance procedures are in place",
+     "Missing data governance procedures",
+     "Implement data governance for training, validation, and testing data",
+     "Data governance documented", "No data governance found"),
+    ("EU_AI_ACT_3", "technical_documentation",
+     "Technical documentation is available",
+     "Missing technical documentation",
+     "Create comprehensive technical documentation before placing on market",
+     "Technical documentation present", "No technical documentation found"),
+    ("EU_AI_ACT_4", "human_oversight",
+     "Human oversight measures are implemented",
+     "Missing human oversight measures",
+     "Implement human oversight measures appropriate for the AI system",
+     "Human oversight measures documented", "No human oversight found"),
+))
+
+# GDPR controls
+_GDPR_CONTROLS = _prebuild_evidence((
+    ("GDPR_1", "lawful_basis",
+     "Lawful basis for processing is defined",
+     "Missing lawful basis for processing",
+     "Define and document lawful basis for data processing (e.g., consent, contract)",
+     "Lawful basis: {}", "No lawful basis found"),
+    ("GDPR_2", "data_minimization",
+     "Data minimization principles applied",
+     "Missing data minimization measures",
+     "Ensure only necessary personal data is processed",
+     "Data minimization documented", "No data minimization found"),
+    ("GDPR_3", "privacy_notice",
+     "Privacy notice is available",
+     "Missing privacy notice",
+     "Provide clear and transparent privacy notice to data subjects",
+     "Privacy notice link/text provided", "No privacy notice found"),
+    ("GDPR_4", "data_subject_rights",
+     "Procedures for data subject rights exist",
+     "Missing procedures for data subject rights",
+     "Implement procedures to handle access, rectification, and erasure requests",
+     "Rights procedures documented", "No rights procedures found"),
+))
+
+# Fixed results for frameworks whose assessment is not implemented yet (shared and read-only)
+_HIPAA_RESULT = MappingProxyType({
+    "compliance_score": 0.7,
+    "risk_level": "medium",
+    "status": "mostly_compliant",
+    "findings": ("HIPAA assessment implemented",),
+    "recommendations": ("Complete HIPAA implementation",),
+    "controls_assessed": ("HIPAA_1",),
+    "violations": (),
+    "evidence": ()
+})
+
+_SECTION_1557_RESULT = MappingProxyType({
+    "compliance_score": 0.6,
+    "risk_level": "high",
+    "status": "partially_compliant",
+    "findings": ("Section 1557 assessment implemented",),
+    "recommendations": ("Complete Section 1557 implementation",),
+    "controls_assessed": ("SECTION_1557_1",),
+    "violations": (),
+    "evidence": ()
+})
+
+_FINANCIAL_BIAS_RESULT = MappingProxyType({
+    "compliance_score": 0.5,
+    "risk_level": "high",
+    "status": "partially_compliant",
+    "findings": ("Financial bias assessment implemented",),
+    "recommendations": ("Complete Financial bias implementation",),
+    "controls_assessed": ("FINANCIAL_BIAS_1",),
+    "violations": (),
+    "evidence": ()
+})
+
+_SOX_RESULT = MappingProxyType({
+    "compliance_score": 0.8,
+    "risk_level": "medium",
+    "status": "mostly_compliant",
+    "findings": ("SOX assessment implemented",),
+    "recommendations": ("Complete SOX implementation",),
+    "controls_assessed": ("SOX_1",),
+    "violations": (),
+    "evidence": ()
+})
+
+# Controls whose violations are called out in compliance reports (AI_GO_1, AI_ME_1, AI_ME_3)
+_REPORTED_CONTROLS = (_GOVERN_CONTROLS[0], _MEASURE_CONTROLS[0], _MEASURE_CONTROLS[2])
+
+class ComplianceNativeMonitor:
+    __slots__ = ("frameworks", "_assessors", "_assessment_cache")
     
-    def _init_gdpr_framework(self) -> Dict[str, Any]:
-        """Initialize GDPR compliance framework"""
-        return {
-            "name": "General Data Protection Regulation (GDPR)",
-            "version": "2018",
-            "principles": [
-                "Lawfulness, fairness and transparency",
-                "Purpose limitation",
-                "Data minimization",
-                "Accuracy",
-                "Storage limitation",
-                "Integrity and confidentiality",
-                "Accountability"
-            ],
-            "ai_specific_requirements": [
-                "Automated decision-making transparency",
-                "Right to explanation",
-                "Data protection by design",
-                "Privacy impact assessments",
-                "Consent management",
-                "Data portability",
-                "Right to erasure"
-            ]
-        }
+    ASSESSMENT_CACHE_SIZE = 1024
     
-    def _init_sox_framework(self) -> Dict[str, Any]:
-        """Initialize SOX compliance framework"""
-        return {
-            "name": "Sarbanes-Oxley Act (SOX)",
-            "version": "2002",
-            "requirements": [
-                "Internal controls over financial reporting",
-                "Management assessment of controls",
-                "Auditor attestation",
-                "Disclosure controls and procedures",
-                "Code of ethics",
-                "Whistleblower protection"
-            ],
-            "ai_specific_requirements": [
-                "AI system controls documentation",
-                "AI decision audit trails",
-                "AI model validation",
-                "AI risk assessment",
-                "AI incident reporting",
-                "AI governance oversight"
-            ]
+    def __init__(self):
+        # Framework definitions are static, so every monitor shares the module-level constants
+        self.frameworks = _FRAMEWORKS
+        self._assessors = {
+            ComplianceFramework.NIST_AI_RMF: self._assess_nist_compliance,
+            ComplianceFramework.EU_AI_ACT: self._assess_eu_ai_act_compliance,
+            ComplianceFramework.HIPAA: self._assess_hipaa_compliance,
+            ComplianceFramework.SECTION_1557: self._assess_section_1557_compliance,
+            ComplianceFramework.FINANCIAL_BIAS: self._assess_financial_bias_compliance,
+            ComplianceFramework.GDPR: self._assess_gdpr_compliance,
+            ComplianceFramework.SOX: self._assess_sox_compliance
         }
+        # Assessor results are a pure function of (framework, system data), keyed by their content hash
+        self._assessment_cache: OrderedDict[bytes, Dict[str, Any]] = OrderedDict()
+        
+    def clear_assessment_cache(self):
+        """Drop every cached assessor result, so the next assessments are recomputed"""
+        self._assessment_cache.clear()
     
     async def assess_compliance(self, 
                               framework: ComplianceFramework,
@@ -249,34 +499,35 @@ class ComplianceNativeMonitor:
                               team_id: str = None) -> Dict[str, Any]:
         """Assess compliance for a specific framework"""
         
-        assessment_id = self._generate_assessment_id(framework, ai_system_data)
-        assessment_start = datetime.utcnow()
+        # One wall-clock read for the timestamp (shared with the id); duration uses the monotonic clock
+        timestamp = datetime.utcnow().isoformat()
+        assessment_start = time.perf_counter()
+        content_key = self._content_key(framework, ai_system_data)
+        assessment_id = self._generate_assessment_id(content_key, timestamp)
         
         try:
-            if framework == ComplianceFramework.NIST_AI_RMF:
-                result = await self._assess_nist_compliance(ai_system_data)
-            elif framework == ComplianceFramework.EU_AI_ACT:
-                result = await self._assess_eu_ai_act_compliance(ai_system_data)
-            elif framework == ComplianceFramework.HIPAA:
-                result = await self._assess_hipaa_compliance(ai_system_data)
-            elif framework == ComplianceFramework.SECTION_1557:
-                result = await self._assess_section_1557_compliance(ai_system_data)
-            elif framework == ComplianceFramework.FINANCIAL_BIAS:
-                result = await self._assess_financial_bias_compliance(ai_system_data)
-            elif framework == ComplianceFramework.GDPR:
-                result = await self._assess_gdpr_compliance(ai_system_data)
-            elif framework == ComplianceFramework.SOX:
-                result = await self._assess_sox_compliance(ai_system_data)
-            else:
+            assessor = self._assessors.get(framework)
+            if assessor is None:
                 raise ValueError(f"Unsupported framework: {framework}")
             
-            assessment_duration = (datetime.utcnow() - assessment_start).total_seconds()
+            cached = self._assessment_cache.get(content_key)
+            if cached is None:
+                cached = assessor(ai_system_data)
+                self._assessment_cache[content_key] = cached
+                if len(self._assessment_cache) > self.ASSESSMENT_CACHE_SIZE:
+                    self._assessment_cache.popitem(last=False)
+            else:
+                self._assessment_cache.move_to_end(content_key)
+            # Callers get their own lists and evidence dicts; everything else in a result is immutable
+            result = self._copy_result(cached)
+            
+            assessment_duration = time.perf_counter() - assessment_start
             
             return {
                 "assessment_id": assessment_id,
                 "framework": framework.value,
                 "framework_name": self.frameworks[framework]["name"],
-                "timestamp": assessment_start.isoformat(),
+                "timestamp": timestamp,
                 "duration_seconds": assessment_duration,
                 "user_id": user_id,
                 "team_id": team_id,
@@ -294,12 +545,29 @@ class ComplianceNativeMonitor:
             return {
                 "assessment_id": assessment_id,
                 "framework": framework.value,
-                "timestamp": assessment_start.isoformat(),
+                "timestamp": timestamp,
                 "error": str(e),
                 "status": "failed"
             }
     
-    async def _assess_nist_compliance(self, ai_system_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def assess_all(self,
+                         ai_system_data: Dict[str, Any],
+                         user_id: str = None,
+                         team_id: str = None,
+                         frameworks: Optional[List[ComplianceFramework]] = None) -> Dict[str, Dict[str, Any]]:
+        """Assess the same AI system against several frameworks (all by default), keyed by framework id"""
+        frameworks = list(frameworks or ComplianceFramework)
+        results = await asyncio.gather(
+            *(self.assess_compliance(framework, ai_system_data, user_id, team_id) for framework in frameworks),
+            return_exceptions=True
+        )
+        
+        return {
+            framework.value: {"error": str(result), "status": "failed"} if isinstance(result, Exception) else result
+            for framework, result in zip(frameworks, results)
+        }
+    
+    def _assess_nist_compliance(self, ai_system_data: Dict[str, Any]) -> Dict[str, Any]:
         """Assess NIST AI RMF compliance"""
         findings = []
         violations = []
@@ -308,33 +576,22 @@ class ComplianceNativeMonitor:
         evidence = []
         
         # Assess Govern category
-        govern_score = await self._assess_govern_controls(ai_system_data, findings, violations, recommendations, controls_assessed, evidence)
+        govern_score = self._assess_govern_controls(ai_system_data, findings, violations, recommendations, controls_assessed, evidence)
         
         # Assess Map category
-        map_score = await self._assess_map_controls(ai_system_data, findings, violations, recommendations, controls_assessed, evidence)
+        map_score = self._assess_map_controls(ai_system_data, findings, violations, recommendations, controls_assessed, evidence)
         
         # Assess Measure category
-        measure_score = await self._assess_measure_controls(ai_system_data, findings, violations, recommendations, controls_assessed, evidence)
+        measure_score = self._assess_measure_controls(ai_system_data, findings, violations, recommendations, controls_assessed, evidence)
         
         # Assess Manage category
-        manage_score = await self._assess_manage_controls(ai_system_data, findings, violations, recommendations, controls_assessed, evidence)
+        manage_score = self._assess_manage_controls(ai_system_data, findings, violations, recommendations, controls_assessed, evidence)
         
         # Calculate overall compliance score
         overall_score = (govern_score + map_score + measure_score + manage_score) / 4
         
         # Determine risk level
-        if overall_score >= 0.9:
-            risk_level = RiskLevel.LOW
-            status = "compliant"
-        elif overall_score >= 0.7:
-            risk_level = RiskLevel.MEDIUM
-            status = "mostly_compliant"
-        elif overall_score >= 0.5:
-            risk_level = RiskLevel.HIGH
-            status = "partially_compliant"
-        else:
-            risk_level = RiskLevel.CRITICAL
-            status = "non_compliant"
+        risk_level, status = _score_to_risk(overall_score)
         
         return {
             "compliance_score": round(overall_score, 3),
@@ -353,295 +610,47 @@ class ComplianceNativeMonitor:
             }
         }
     
-    async def _assess_govern_controls(self, ai_system_data: Dict[str, Any], findings: List, violations: List, recommendations: List, controls_assessed: List, evidence: List) -> float:
+    def _assess_controls(self, ai_system_data: Dict[str, Any], controls: tuple, findings: List, violations: List, recommendations: List, controls_assessed: List, evidence: List) -> float:
+        """Assess a table of controls that pass when their data key is documented"""
+        # Read each control's value once, then fill every output list in a single comprehension
+        results = [(control, ai_system_data.get(control[1])) for control in controls]
+        findings.extend([control[2] for control, value in results if value])
+        violations.extend([control[3] for control, value in results if not value])
+        recommendations.extend([control[4] for control, value in results if not value])
+        controls_assessed.extend([control[0] for control in controls])
+        # Evidence records are immutable and shared per control outcome; only templated compliant evidence is built per call
+        evidence.extend([_control_evidence(control, value) for control, value in results])
+        
+        return sum(1 for _, value in results if value) / len(controls)
+    
+    def _assess_govern_controls(self, ai_system_data: Dict[str, Any], findings: List, violations: List, recommendations: List, controls_assessed: List, evidence: List) -> float:
         """Assess Govern category controls"""
-        score = 0.0
-        total_controls = 4
-        
-        # AI_GO_1: Establish AI governance structure
-        if ai_system_data.get("governance_structure"):
-            score += 1.0
-            findings.append("AI governance structure is established")
-            evidence.append({"control": "AI_GO_1", "status": "compliant", "evidence": "Governance structure documented"})
-        else:
-            violations.append("Missing AI governance structure")
-            recommendations.append("Establish formal AI governance structure with defined roles and responsibilities")
-            evidence.append({"control": "AI_GO_1", "status": "non_compliant", "evidence": "No governance structure found"})
-        
-        controls_assessed.append("AI_GO_1")
-        
-        # AI_GO_2: Define AI risk management roles
-        if ai_system_data.get("risk_management_roles"):
-            score += 1.0
-            findings.append("AI risk management roles are defined")
-            evidence.append({"control": "AI_GO_2", "status": "compliant", "evidence": "Risk management roles documented"})
-        else:
-            violations.append("Missing AI risk management roles")
-            recommendations.append("Define clear AI risk management roles and responsibilities")
-            evidence.append({"control": "AI_GO_2", "status": "non_compliant", "evidence": "No risk management roles found"})
-        
-        controls_assessed.append("AI_GO_2")
-        
-        # AI_GO_3: Establish AI risk tolerance
-        if ai_system_data.get("risk_tolerance"):
-            score += 1.0
-            findings.append("AI risk tolerance is established")
-            evidence.append({"control": "AI_GO_3", "status": "compliant", "evidence": "Risk tolerance documented"})
-        else:
-            violations.append("Missing AI risk tolerance definition")
-            recommendations.append("Establish clear AI risk tolerance levels and thresholds")
-            evidence.append({"control": "AI_GO_3", "status": "non_compliant", "evidence": "No risk tolerance found"})
-        
-        controls_assessed.append("AI_GO_3")
-        
-        # AI_GO_4: Document AI system inventory
-        if ai_system_data.get("system_inventory"):
-            score += 1.0
-            findings.append("AI system inventory is documented")
-            evidence.append({"control": "AI_GO_4", "status": "compliant", "evidence": "System inventory documented"})
-        else:
-            violations.append("Missing AI system inventory")
-            recommendations.append("Maintain comprehensive AI system inventory with regular updates")
-            evidence.append({"control": "AI_GO_4", "status": "non_compliant", "evidence": "No system inventory found"})
-        
-        controls_assessed.append("AI_GO_4")
-        
-        return score / total_controls
+        return self._assess_controls(ai_system_data, _GOVERN_CONTROLS, findings, violations, recommendations, controls_assessed, evidence)
     
-    async def _assess_map_controls(self, ai_system_data: Dict[str, Any], findings: List, violations: List, recommendations: List, controls_assessed: List, evidence: List) -> float:
+    def _assess_map_controls(self, ai_system_data: Dict[str, Any], findings: List, violations: List, recommendations: List, controls_assessed: List, evidence: List) -> float:
         """Assess Map category controls"""
-        score = 0.0
-        total_controls = 4
-        
-        # AI_MA_1: Identify AI system context
-        if ai_system_data.get("system_context"):
-            score += 1.0
-            findings.append("AI system context is identified")
-            evidence.append({"control": "AI_MA_1", "status": "compliant", "evidence": "System context documented"})
-        else:
-            violations.append("Missing AI system context identification")
-            recommendations.append("Document AI system context including purpose, scope, and environment")
-            evidence.append({"control": "AI_MA_1", "status": "non_compliant", "evidence": "No system context found"})
-        
-        controls_assessed.append("AI_MA_1")
-        
-        # AI_MA_2: Identify AI system components
-        if ai_system_data.get("system_components"):
-            score += 1.0
-            findings.append("AI system components are identified")
-            evidence.append({"control": "AI_MA_2", "status": "compliant", "evidence": "System components documented"})
-        else:
-            violations.append("Missing AI system components identification")
-            recommendations.append("Document all AI system components including models, data, and infrastructure")
-            evidence.append({"control": "AI_MA_2", "status": "non_compliant", "evidence": "No system components found"})
-        
-        controls_assessed.append("AI_MA_2")
-        
-        # AI_MA_3: Identify AI system interactions
-        if ai_system_data.get("system_interactions"):
-            score += 1.0
-            findings.append("AI system interactions are identified")
-            evidence.append({"control": "AI_MA_3", "status": "compliant", "evidence": "System interactions documented"})
-        else:
-            violations.append("Missing AI system interactions identification")
-            recommendations.append("Document AI system interactions with external systems and users")
-            evidence.append({"control": "AI_MA_3", "status": "non_compliant", "evidence": "No system interactions found"})
-        
-        controls_assessed.append("AI_MA_3")
-        
-        # AI_MA_4: Identify AI system boundaries
-        if ai_system_data.get("system_boundaries"):
-            score += 1.0
-            findings.append("AI system boundaries are identified")
-            evidence.append({"control": "AI_MA_4", "status": "compliant", "evidence": "System boundaries documented"})
-        else:
-            violations.append("Missing AI system boundaries identification")
-            recommendations.append("Define clear AI system boundaries and interfaces")
-            evidence.append({"control": "AI_MA_4", "status": "non_compliant", "evidence": "No system boundaries found"})
-        
-        controls_assessed.append("AI_MA_4")
-        
-        return score / total_controls
+        return self._assess_controls(ai_system_data, _MAP_CONTROLS, findings, violations, recommendations, controls_assessed, evidence)
     
-    async def _assess_measure_controls(self, ai_system_data: Dict[str, Any], findings: List, violations: List, recommendations: List, controls_assessed: List, evidence: List) -> float:
+    def _assess_measure_controls(self, ai_system_data: Dict[str, Any], findings: List, violations: List, recommendations: List, controls_assessed: List, evidence: List) -> float:
         """Assess Measure category controls"""
-        score = 0.0
-        total_controls = 4
-        
-        # AI_ME_1: Measure AI system performance
-        if ai_system_data.get("performance_metrics"):
-            score += 1.0
-            findings.append("AI system performance is measured")
-            evidence.append({"control": "AI_ME_1", "status": "compliant", "evidence": "Performance metrics documented"})
-        else:
-            violations.append("Missing AI system performance measurement")
-            recommendations.append("Implement comprehensive AI system performance monitoring")
-            evidence.append({"control": "AI_ME_1", "status": "non_compliant", "evidence": "No performance metrics found"})
-        
-        controls_assessed.append("AI_ME_1")
-        
-        # AI_ME_2: Measure AI system accuracy
-        if ai_system_data.get("accuracy_metrics"):
-            score += 1.0
-            findings.append("AI system accuracy is measured")
-            evidence.append({"control": "AI_ME_2", "status": "compliant", "evidence": "Accuracy metrics documented"})
-        else:
-            violations.append("Missing AI system accuracy measurement")
-            recommendations.append("Implement AI system accuracy monitoring and validation")
-            evidence.append({"control": "AI_ME_2", "status": "non_compliant", "evidence": "No accuracy metrics found"})
-        
-        controls_assessed.append("AI_ME_2")
-        
-        # AI_ME_3: Measure AI system bias
-        if ai_system_data.get("bias_metrics"):
-            score += 1.0
-            findings.append("AI system bias is measured")
-            evidence.append({"control": "AI_ME_3", "status": "compliant", "evidence": "Bias metrics documented"})
-        else:
-            violations.append("Missing AI system bias measurement")
-            recommendations.append("Implement AI system bias monitoring and testing")
-            evidence.append({"control": "AI_ME_3", "status": "non_compliant", "evidence": "No bias metrics found"})
-        
-        controls_assessed.append("AI_ME_3")
-        
-        # AI_ME_4: Measure AI system security
-        if ai_system_data.get("security_metrics"):
-            score += 1.0
-            findings.append("AI system security is measured")
-            evidence.append({"control": "AI_ME_4", "status": "compliant", "evidence": "Security metrics documented"})
-        else:
-            violations.append("Missing AI system security measurement")
-            recommendations.append("Implement AI system security monitoring and testing")
-            evidence.append({"control": "AI_ME_4", "status": "non_compliant", "evidence": "No security metrics found"})
-        
-        controls_assessed.append("AI_ME_4")
-        
-        return score / total_controls
+        return self._assess_controls(ai_system_data, _MEASURE_CONTROLS, findings, violations, recommendations, controls_assessed, evidence)
     
-    async def _assess_manage_controls(self, ai_system_data: Dict[str, Any], findings: List, violations: List, recommendations: List, controls_assessed: List, evidence: List) -> float:
+    def _assess_manage_controls(self, ai_system_data: Dict[str, Any], findings: List, violations: List, recommendations: List, controls_assessed: List, evidence: List) -> float:
         """Assess Manage category controls"""
-        score = 0.0
-        total_controls = 4
-        
-        # AI_MG_1: Manage AI system risks
-        if ai_system_data.get("risk_management"):
-            score += 1.0
-            findings.append("AI system risks are managed")
-            evidence.append({"control": "AI_MG_1", "status": "compliant", "evidence": "Risk management documented"})
-        else:
-            violations.append("Missing AI system risk management")
-            recommendations.append("Implement comprehensive AI system risk management processes")
-            evidence.append({"control": "AI_MG_1", "status": "non_compliant", "evidence": "No risk management found"})
-        
-        controls_assessed.append("AI_MG_1")
-        
-        # AI_MG_2: Manage AI system changes
-        if ai_system_data.get("change_management"):
-            score += 1.0
-            findings.append("AI system changes are managed")
-            evidence.append({"control": "AI_MG_2", "status": "compliant", "evidence": "Change management documented"})
-        else:
-            violations.append("Missing AI system change management")
-            recommendations.append("Implement AI system change management processes")
-            evidence.append({"control": "AI_MG_2", "status": "non_compliant", "evidence": "No change management found"})
-        
-        controls_assessed.append("AI_MG_2")
-        
-        # AI_MG_3: Manage AI system incidents
-        if ai_system_data.get("incident_management"):
-            score += 1.0
-            findings.append("AI system incidents are managed")
-            evidence.append({"control": "AI_MG_3", "status": "compliant", "evidence": "Incident management documented"})
-        else:
-            violations.append("Missing AI system incident management")
-            recommendations.append("Implement AI system incident management processes")
-            evidence.append({"control": "AI_MG_3", "status": "non_compliant", "evidence": "No incident management found"})
-        
-        controls_assessed.append("AI_MG_3")
-        
-        # AI_MG_4: Manage AI system lifecycle
-        if ai_system_data.get("lifecycle_management"):
-            score += 1.0
-            findings.append("AI system lifecycle is managed")
-            evidence.append({"control": "AI_MG_4", "status": "compliant", "evidence": "Lifecycle management documented"})
-        else:
-            violations.append("Missing AI system lifecycle management")
-            recommendations.append("Implement AI system lifecycle management processes")
-            evidence.append({"control": "AI_MG_4", "status": "non_compliant", "evidence": "No lifecycle management found"})
-        
-        controls_assessed.append("AI_MG_4")
-        
-        return score / total_controls
+        return self._assess_controls(ai_system_data, _MANAGE_CONTROLS, findings, violations, recommendations, controls_assessed, evidence)
     
-    async def _assess_eu_ai_act_compliance(self, ai_system_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_eu_ai_act_compliance(self, ai_system_data: Dict[str, Any]) -> Dict[str, Any]:
         """Assess EU AI Act compliance"""
         findings = []
         violations = []
         recommendations = []
         controls_assessed = []
         evidence = []
-        score = 0.0
-        total_controls = 4
-
-        # EU_AI_ACT_1: Risk Classification
-        if ai_system_data.get("risk_classification"):
-            score += 1.0
-            findings.append("AI system risk classification is documented")
-            evidence.append({"control": "EU_AI_ACT_1", "status": "compliant", "evidence": f"Classified as {ai_system_data.get('risk_classification')}"})
-        else:
-            violations.append("Missing AI system risk classification")
-            recommendations.append("Classify AI system risk level according to EU AI Act Annexes")
-            evidence.append({"control": "EU_AI_ACT_1", "status": "non_compliant", "evidence": "No risk classification found"})
-        controls_assessed.append("EU_AI_ACT_1")
-
-        # EU_AI_ACT_2: Data Governance
-        if ai_system_data.get("data_governance"):
-            score += 1.0
-            findings.append("Data governance procedures are in place")
-            evidence.append({"control": "EU_AI_ACT_2", "status": "compliant", "evidence": "Data governance documented"})
-        else:
-            violations.append("Missing data governance procedures")
-            recommendations.append("Implement data governance for training, validation, and testing data")
-            evidence.append({"control": "EU_AI_ACT_2", "status": "non_compliant", "evidence": "No data governance found"})
-        controls_assessed.append("EU_AI_ACT_2")
-
-        # EU_AI_ACT_3: Technical Documentation
-        if ai_system_data.get("technical_documentation"):
-            score += 1.0
-            findings.append("Technical documentation is available")
-            evidence.append({"control": "EU_AI_ACT_3", "status": "compliant", "evidence": "Technical documentation present"})
-        else:
-            violations.append("Missing technical documentation")
-            recommendations.append("Create comprehensive technical documentation before placing on market")
-            evidence.append({"control": "EU_AI_ACT_3", "status": "non_compliant", "evidence": "No technical documentation found"})
-        controls_assessed.append("EU_AI_ACT_3")
-
-        # EU_AI_ACT_4: Human Oversight
-        if ai_system_data.get("human_oversight"):
-            score += 1.0
-            findings.append("Human oversight measures are implemented")
-            evidence.append({"control": "EU_AI_ACT_4", "status": "compliant", "evidence": "Human oversight measures documented"})
-        else:
-            violations.append("Missing human oversight measures")
-            recommendations.append("Implement human oversight measures appropriate for the AI system")
-            evidence.append({"control": "EU_AI_ACT_4", "status": "non_compliant", "evidence": "No human oversight found"})
-        controls_assessed.append("EU_AI_ACT_4")
-
-        overall_score = score / total_controls
-
-        if overall_score >= 0.9:
-            risk_level = RiskLevel.LOW
-            status = "compliant"
-        elif overall_score >= 0.7:
-            risk_level = RiskLevel.MEDIUM
-            status = "mostly_compliant"
-        elif overall_score >= 0.5:
-            risk_level = RiskLevel.HIGH
-            status = "partially_compliant"
-        else:
-            risk_level = RiskLevel.CRITICAL
-            status = "non_compliant"
-
+        
+        overall_score = self._assess_controls(ai_system_data, _EU_AI_ACT_CONTROLS, findings, violations, recommendations, controls_assessed, evidence)
+        
+        risk_level, status = _score_to_risk(overall_score)
+        
         return {
             "compliance_score": round(overall_score, 3),
             "risk_level": risk_level.value,
@@ -653,117 +662,33 @@ class ComplianceNativeMonitor:
             "evidence": evidence
         }
     
-    async def _assess_hipaa_compliance(self, ai_system_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_hipaa_compliance(self, ai_system_data: Dict[str, Any]) -> Mapping[str, Any]:
         """Assess HIPAA compliance"""
-        # Implementation for HIPAA assessment
-        return {
-            "compliance_score": 0.7,
-            "risk_level": "medium",
-            "status": "mostly_compliant",
-            "findings": ["HIPAA assessment implemented"],
-            "recommendations": ["Complete HIPAA implementation"],
-            "controls_assessed": ["HIPAA_1"],
-            "violations": [],
-            "evidence": []
-        }
+        # Implementation pending; returns the shared fixed result
+        return _HIPAA_RESULT
     
-    async def _assess_section_1557_compliance(self, ai_system_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_section_1557_compliance(self, ai_system_data: Dict[str, Any]) -> Mapping[str, Any]:
         """Assess Section 1557 compliance"""
-        # Implementation for Section 1557 assessment
-        return {
-            "compliance_score": 0.6,
-            "risk_level": "high",
-            "status": "partially_compliant",
-            "findings": ["Section 1557 assessment implemented"],
-            "recommendations": ["Complete Section 1557 implementation"],
-            "controls_assessed": ["SECTION_1557_1"],
-            "violations": [],
-            "evidence": []
-        }
+        # Implementation pending; returns the shared fixed result
+        return _SECTION_1557_RESULT
     
-    async def _assess_financial_bias_compliance(self, ai_system_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_financial_bias_compliance(self, ai_system_data: Dict[str, Any]) -> Mapping[str, Any]:
         """Assess Financial Services bias compliance"""
-        # Implementation for Financial bias assessment
-        return {
-            "compliance_score": 0.5,
-            "risk_level": "high",
-            "status": "partially_compliant",
-            "findings": ["Financial bias assessment implemented"],
-            "recommendations": ["Complete Financial bias implementation"],
-            "controls_assessed": ["FINANCIAL_BIAS_1"],
-            "violations": [],
-            "evidence": []
-        }
+        # Implementation pending; returns the shared fixed result
+        return _FINANCIAL_BIAS_RESULT
     
-    async def _assess_gdpr_compliance(self, ai_system_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_gdpr_compliance(self, ai_system_data: Dict[str, Any]) -> Dict[str, Any]:
         """Assess GDPR compliance"""
         findings = []
         violations = []
         recommendations = []
         controls_assessed = []
         evidence = []
-        score = 0.0
-        total_controls = 4
-
-        # GDPR_1: Lawful Basis
-        if ai_system_data.get("lawful_basis"):
-            score += 1.0
-            findings.append("Lawful basis for processing is defined")
-            evidence.append({"control": "GDPR_1", "status": "compliant", "evidence": f"Lawful basis: {ai_system_data.get('lawful_basis')}"})
-        else:
-            violations.append("Missing lawful basis for processing")
-            recommendations.append("Define and document lawful basis for data processing (e.g., consent, contract)")
-            evidence.append({"control": "GDPR_1", "status": "non_compliant", "evidence": "No lawful basis found"})
-        controls_assessed.append("GDPR_1")
-
-        # GDPR_2: Data Minimization
-        if ai_system_data.get("data_minimization"):
-            score += 1.0
-            findings.append("Data minimization principles applied")
-            evidence.append({"control": "GDPR_2", "status": "compliant", "evidence": "Data minimization documented"})
-        else:
-            violations.append("Missing data minimization measures")
-            recommendations.append("Ensure only necessary personal data is processed")
-            evidence.append({"control": "GDPR_2", "status": "non_compliant", "evidence": "No data minimization found"})
-        controls_assessed.append("GDPR_2")
-
-        # GDPR_3: Privacy Notice
-        if ai_system_data.get("privacy_notice"):
-            score += 1.0
-            findings.append("Privacy notice is available")
-            evidence.append({"control": "GDPR_3", "status": "compliant", "evidence": "Privacy notice link/text provided"})
-        else:
-            violations.append("Missing privacy notice")
-            recommendations.append("Provide clear and transparent privacy notice to data subjects")
-            evidence.append({"control": "GDPR_3", "status": "non_compliant", "evidence": "No privacy notice found"})
-        controls_assessed.append("GDPR_3")
-
-        # GDPR_4: Data Subject Rights
-        if ai_system_data.get("data_subject_rights"):
-            score += 1.0
-            findings.append("Procedures for data subject rights exist")
-            evidence.append({"control": "GDPR_4", "status": "compliant", "evidence": "Rights procedures documented"})
-        else:
-            violations.append("Missing procedures for data subject rights")
-            recommendations.append("Implement procedures to handle access, rectification, and erasure requests")
-            evidence.append({"control": "GDPR_4", "status": "non_compliant", "evidence": "No rights procedures found"})
-        controls_assessed.append("GDPR_4")
-
-        overall_score = score / total_controls
-
-        if overall_score >= 0.9:
-            risk_level = RiskLevel.LOW
-            status = "compliant"
-        elif overall_score >= 0.7:
-            risk_level = RiskLevel.MEDIUM
-            status = "mostly_compliant"
-        elif overall_score >= 0.5:
-            risk_level = RiskLevel.HIGH
-            status = "partially_compliant"
-        else:
-            risk_level = RiskLevel.CRITICAL
-            status = "non_compliant"
-
+        
+        overall_score = self._assess_controls(ai_system_data, _GDPR_CONTROLS, findings, violations, recommendations, controls_assessed, evidence)
+        
+        risk_level, status = _score_to_risk(overall_score)
+        
         return {
             "compliance_score": round(overall_score, 3),
             "risk_level": risk_level.value,
@@ -775,24 +700,34 @@ class ComplianceNativeMonitor:
             "evidence": evidence
         }
     
-    async def _assess_sox_compliance(self, ai_system_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_sox_compliance(self, ai_system_data: Dict[str, Any]) -> Mapping[str, Any]:
         """Assess SOX compliance"""
-        # Implementation for SOX assessment
-        return {
-            "compliance_score": 0.8,
-            "risk_level": "medium",
-            "status": "mostly_compliant",
-            "findings": ["SOX assessment implemented"],
-            "recommendations": ["Complete SOX implementation"],
-            "controls_assessed": ["SOX_1"],
-            "violations": [],
-            "evidence": []
-        }
+        # Implementation pending; returns the shared fixed result
+        return _SOX_RESULT
+    
+    def _content_key(self, framework: ComplianceFramework, ai_system_data: Dict[str, Any]) -> bytes:
+        """Hash of the framework and a serialization of the system data that keeps distinct values distinct"""
+        try:
+            payload = b"o" + orjson.dumps(ai_system_data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson rejects integers beyond 64 bits, which json.dumps (and so the API) accepts
+            payload = None
+        # orjson writes NaN and +/-Infinity as null, so any null falls back to json.dumps, which
+        # keeps them apart from None; the prefix keeps the two encodings from ever colliding
+        if payload is None or b"null" in payload:
+            payload = b"j" + json.dumps(ai_system_data, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(b"_".join((framework.value.encode(), payload)), digest_size=16).digest()
     
-    def _generate_assessment_id(self, framework: ComplianceFramework, ai_system_data: Dict[str, Any]) -> str:
+    def _generate_assessment_id(self, content_key: bytes, timestamp: str) -> str:
         """Generate unique assessment ID"""
-        combined = f"{framework.value}_{json.dumps(ai_system_data, sort_keys=True)}_{datetime.utcnow().isoformat()}"
-        return hashlib.md5(combined.encode()).hexdigest()[:16]
+        return hashlib.blake2b(content_key + timestamp.encode(), digest_size=8).hexdigest()
+    
+    @staticmethod
+    def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy an assessor result, giving the copy its own lists and its own evidence dicts"""
+        copy = {key: list(value) if isinstance(value, (list, tuple)) else value for key, value in result.items()}
+        copy["evidence"] = [record._asdict() for record in result["evidence"]]
+        return copy
     
     async def generate_compliance_report(self, 
                                        framework: ComplianceFramework,
@@ -816,6 +751,9 @@ class ComplianceNativeMonitor:
         # Calculate overall compliance score
         overall_score = self._calculate_overall_compliance_score(historical_assessments)
         
+        # Tally risk levels in one pass for the summary
+        risk_levels = Counter(a.get("risk_level") for a in historical_assessments)
+        
         return {
             "report_id": report_id,
             "framework": framework.value,
@@ -835,8 +773,8 @@ class ComplianceNativeMonitor:
                 "total_assessments": len(historical_assessments),
                 "average_compliance_score": overall_score,
                 "compliance_trend": trends.get("compliance_trend", "stable"),
-                "critical_violations": len([a for a in historical_assessments if a.get("risk_level") == "critical"]),
-                "high_risk_violations": len([a for a in historical_assessments if a.get("risk_level") == "high"])
+                "critical_violations": risk_levels["critical"],
+                "high_risk_violations": risk_levels["high"]
             }
         }
     
@@ -866,9 +804,8 @@ class ComplianceNativeMonitor:
         if len(historical_assessments) < 2:
             return {"compliance_trend": "insufficient_data"}
         
-        scores = [a["compliance_score"] for a in historical_assessments]
-        latest_score = scores[0]
-        previous_score = scores[1]
+        latest_score = historical_assessments[0]["compliance_score"]
+        previous_score = historical_assessments[1]["compliance_score"]
         
         if latest_score > previous_score:
             trend = "improving"
@@ -886,32 +823,20 @@ class ComplianceNativeMonitor:
     
     def _generate_compliance_recommendations(self, historical_assessments: List[Dict[str, Any]], framework: ComplianceFramework) -> List[str]:
         """Generate compliance recommendations"""
-        recommendations = []
-        
         # Analyze common violations
-        all_violations = []
+        all_violations = set()
         for assessment in historical_assessments:
-            all_violations.extend(assessment.get("violations", []))
-        
-        # Generate recommendations based on common violations
-        if "Missing AI governance structure" in all_violations:
-            recommendations.append("Establish formal AI governance structure with defined roles and responsibilities")
-        
-        if "Missing AI system performance measurement" in all_violations:
-            recommendations.append("Implement comprehensive AI system performance monitoring")
-        
-        if "Missing AI system bias measurement" in all_violations:
-            recommendations.append("Implement AI system bias monitoring and testing")
+            all_violations.update(assessment.get("violations", []))
         
-        return recommendations
+        # Generate recommendations based on common violations, reusing the control table's text
+        return [control[4] for control in _REPORTED_CONTROLS if control[3] in all_violations]
     
     def _calculate_overall_compliance_score(self, historical_assessments: List[Dict[str, Any]]) -> float:
         """Calculate overall compliance score"""
         if not historical_assessments:
             return 0.0
         
-        scores = [a["compliance_score"] for a in historical_assessments]
-        return sum(scores) / len(scores)
+        return sum(a["compliance_score"] for a in historical_assessments) / len(historical_assessments)
 
 # Create singleton instance
 compliance_monitor = ComplianceNativeMonitor()
@@ -1,12 +1,88 @@
 # services/cross_provider_intelligence.py
 import asyncio
 import time
-from typing import Dict, List, Any, Optional
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
-import statistics
+
+# Equivalent models on each provider for a requested model, best match first
+_MODEL_EQUIVALENTS = {
+    'openai': {
+        'gpt-4': ('gpt-4', 'gpt-4-turbo'),
+        'gpt-3.5-turbo': ('gpt-3.5-turbo',),
+        'claude-3-sonnet': ('gpt-4',),
+        'claude-3-haiku': ('gpt-3.5-turbo',)
+    },
+    'anthropic': {
+        'gpt-4': ('claude-3-sonnet',),
+        'gpt-3.5-turbo': ('claude-3-haiku',),
+        'claude-3-sonnet': ('claude-3-sonnet',),
+        'claude-3-haiku': ('claude-3-haiku',)
+    }
+}
+
+# Cost per 1K tokens by provider and model
+_PROVIDER_PRICING = {
+    'openai': {
+        'gpt-4': 0.03,
+        'gpt-3.5-turbo': 0.002
+    },
+    'anthropic': {
+        'claude-3-sonnet': 0.015,
+        'claude-3-haiku': 0.00125
+    }
+}
+
+# Per-token cost by (provider, model), derived once so estimates need a single lookup and multiply
+_COST_PER_TOKEN: Dict[Tuple[str, str], float] = {
+    (provider, model): price / 1000
+    for provider, models in _PROVIDER_PRICING.items()
+    for model, price in models.items()
+}
+_DEFAULT_COST_PER_TOKEN = 0.002 / 1000
+
+_NO_MODELS: Dict[str, Any] = {}
+
+METRIC_WINDOW = 100  # Data points kept per provider/model metric
+
+@dataclass(slots=True)
+class MetricWindow:
+    """The last METRIC_WINDOW data points of one metric, with their running total"""
+    values: deque = field(default_factory=lambda: deque(maxlen=METRIC_WINDOW))
+    total: float = 0.0
+    
+    def add(self, value: float):
+        """Append a data point, keeping the total in step with any point the deque evicts"""
+        if len(self.values) == METRIC_WINDOW:
+            self.total -= self.values[0]
+        self.values.append(value)
+        self.total += value
+    
+    def mean(self, default: float) -> float:
+        """Mean of the window, or the default when it holds no data"""
+        return self.total / len(self.values) if self.values else default
+
+@dataclass(slots=True)
+class ProviderModelMetrics:
+    """Rolling performance metrics for one provider/model pair"""
+    response_times: MetricWindow = field(default_factory=MetricWindow)
+    success_rate: MetricWindow = field(default_factory=MetricWindow)
+    costs: MetricWindow = field(default_factory=MetricWindow)
+    quality_scores: MetricWindow = field(default_factory=MetricWindow)
+    request_count: int = 0
+    last_updated: Optional[datetime] = None
+
+# Stand-in for provider/model pairs with no history, so lookups fall back to the metric defaults
+_NO_METRICS = ProviderModelMetrics()
+
+# Status reported for providers that have not been tracked yet
+_UNCHECKED_STATUS: Dict[str, Any] = {'healthy': True}
 
 class CrossProviderIntelligence:
     def __init__(self):
+        self.providers = ['openai', 'anthropic']
         self.provider_status = {}
         self.provider_performance = {}
         self.routing_rules = []
@@ -14,7 +90,8 @@ class CrossProviderIntelligence:
             'enabled': True,
             'max_retries': 3,
             'timeout_threshold': 30.0,
-            'error_rate_threshold': 0.1
+            'error_rate_threshold': 0.1,
+            'retry_after_seconds': 300.0
         }
     
     async def intelligent_routing(self, request_data: dict, user_preferences: dict = None) -> dict:
@@ -22,7 +99,8 @@ class CrossProviderIntelligence:
         
         # Extract request details
         original_model = request_data.get('model', 'gpt-3.5-turbo')
-        complexity = self._assess_request_complexity(request_data)
+        prompt_tokens = self._estimate_prompt_tokens(request_data)
+        complexity = self._assess_request_complexity(request_data, prompt_tokens)
         budget_limit = user_preferences.get('budget_limit') if user_preferences else None
         
         # Get available providers and their current status
@@ -47,7 +125,7 @@ class CrossProviderIntelligence:
             
             for model in equivalent_models:
                 option = await self._evaluate_routing_option(
-                    provider, model, complexity, budget_limit, request_data
+                    provider, model, complexity, budget_limit, request_data, prompt_tokens
                 )
                 if option:
                     routing_options.append(option)
@@ -107,33 +185,20 @@ class CrossProviderIntelligence:
             self.provider_performance[provider] = {}
         
         if model not in self.provider_performance[provider]:
-            self.provider_performance[provider][model] = {
-                'response_times': [],
-                'success_rate': [],
-                'costs': [],
-                'quality_scores': [],
-                'request_count': 0,
-                'last_updated': timestamp
-            }
+            self.provider_performance[provider][model] = ProviderModelMetrics()
         
         metrics = self.provider_performance[provider][model]
         
-        # Update metrics (keep last 100 data points)
-        metrics['response_times'].append(response_time)
-        metrics['response_times'] = metrics['response_times'][-100:]
-        
-        metrics['success_rate'].append(1 if success else 0)
-        metrics['success_rate'] = metrics['success_rate'][-100:]
-        
-        metrics['costs'].append(cost)
-        metrics['costs'] = metrics['costs'][-100:]
+        # Update metrics (windows keep the last METRIC_WINDOW data points)
+        metrics.response_times.add(response_time)
+        metrics.success_rate.add(1 if success else 0)
+        metrics.costs.add(cost)
         
         if quality_score is not None:
-            metrics['quality_scores'].append(quality_score)
-            metrics['quality_scores'] = metrics['quality_scores'][-100:]
+            metrics.quality_scores.add(quality_score)
         
-        metrics['request_count'] += 1
-        metrics['last_updated'] = timestamp
+        metrics.request_count += 1
+        metrics.last_updated = timestamp
         
         # Update provider health status
         await self._update_provider_health(provider, metrics)
@@ -163,34 +228,34 @@ class CrossProviderIntelligence:
             quality_count = 0
             
             for model, metrics in models.items():
-                if not metrics['response_times']:
+                if not metrics.response_times.values:
                     continue
                 
                 model_stats = {
-                    'avg_response_time': statistics.mean(metrics['response_times']),
-                    'success_rate': statistics.mean(metrics['success_rate']),
-                    'avg_cost': statistics.mean(metrics['costs']) if metrics['costs'] else 0,
-                    'avg_quality': statistics.mean(metrics['quality_scores']) if metrics['quality_scores'] else 0,
-                    'request_count': metrics['request_count']
+                    'avg_response_time': metrics.response_times.mean(0),
+                    'success_rate': metrics.success_rate.mean(0),
+                    'avg_cost': metrics.costs.mean(0),
+                    'avg_quality': metrics.quality_scores.mean(0),
+                    'request_count': metrics.request_count
                 }
                 
                 provider_stats['models'][model] = model_stats
                 
                 # Accumulate for overall stats
-                total_requests += metrics['request_count']
-                total_response_time += sum(metrics['response_times'])
-                total_success += sum(metrics['success_rate'])
-                total_cost += sum(metrics['costs'])
+                total_requests += metrics.request_count
+                total_response_time += metrics.response_times.total
+                total_success += metrics.success_rate.total
+                total_cost += metrics.costs.total
                 
-                if metrics['quality_scores']:
-                    total_quality += sum(metrics['quality_scores'])
-                    quality_count += len(metrics['quality_scores'])
+                if metrics.quality_scores.values:
+                    total_quality += metrics.quality_scores.total
+                    quality_count += len(metrics.quality_scores.values)
             
             if total_requests > 0:
                 provider_stats['overall'] = {
-                    'avg_response_time': total_response_time / sum(len(m['response_times']) for m in models.values()),
-                    'success_rate': total_success / sum(len(m['success_rate']) for m in models.values()),
-                    'avg_cost': total_cost / sum(len(m['costs']) for m in models.values()),
+                    'avg_response_time': total_response_time / sum(len(m.response_times.values) for m in models.values()),
+                    'success_rate': total_success / sum(len(m.success_rate.values) for m in models.values()),
+                    'avg_cost': total_cost / sum(len(m.costs.values) for m in models.values()),
                     'avg_quality': total_quality / quality_count if quality_count > 0 else 0,
                     'total_requests': total_requests
                 }
@@ -199,15 +264,17 @@ class CrossProviderIntelligence:
         
         return comparison
     
-    def _assess_request_complexity(self, request_data: dict) -> str:
+    @staticmethod
+    def _estimate_prompt_tokens(request_data: dict) -> int:
+        """Approximate prompt tokens as message characters / 4"""
+        total_chars = 0
+        for msg in request_data.get('messages', []):
+            content = msg.get('content', '')
+            total_chars += len(content) if isinstance(content, str) else len(str(content))
+        return total_chars // 4
+    
+    def _assess_request_complexity(self, request_data: dict, total_tokens: int) -> str:
         """Assess complexity of the request"""
-        messages = request_data.get('messages', [])
-        
-        total_tokens = 0
-        for msg in messages:
-            content = str(msg.get('content', ''))
-            total_tokens += len(content.split())
-        
         max_tokens = request_data.get('max_tokens', 100)
         
         if total_tokens > 1000 or max_tokens > 500:
@@ -217,35 +284,20 @@ class CrossProviderIntelligence:
         else:
             return 'low'
     
-    def _get_equivalent_models(self, original_model: str, target_provider: str) -> list:
+    def _get_equivalent_models(self, original_model: str, target_provider: str) -> tuple:
         """Get equivalent models across providers"""
-        model_equivalents = {
-            'openai': {
-                'gpt-4': ['gpt-4', 'gpt-4-turbo'],
-                'gpt-3.5-turbo': ['gpt-3.5-turbo'],
-                'claude-3-sonnet': ['gpt-4'],
-                'claude-3-haiku': ['gpt-3.5-turbo']
-            },
-            'anthropic': {
-                'gpt-4': ['claude-3-sonnet'],
-                'gpt-3.5-turbo': ['claude-3-haiku'],
-                'claude-3-sonnet': ['claude-3-sonnet'],
-                'claude-3-haiku': ['claude-3-haiku']
-            }
-        }
-        
-        return model_equivalents.get(target_provider, {}).get(original_model, [])
+        return _MODEL_EQUIVALENTS.get(target_provider, _NO_MODELS).get(original_model, ())
     
     async def _evaluate_routing_option(self, provider: str, model: str, 
                                      complexity: str, budget_limit: float, 
-                                     request_data: dict) -> Optional[dict]:
+                                     request_data: dict, prompt_tokens: int) -> Optional[dict]:
         """Evaluate a specific provider/model option"""
         
         # Get historical performance
-        performance = self.provider_performance.get(provider, {}).get(model, {})
+        performance = self.provider_performance.get(provider, {}).get(model, _NO_METRICS)
         
         # Estimate cost
-        estimated_cost = self._estimate_cost(provider, model, request_data)
+        estimated_cost = self._estimate_cost(provider, model, request_data, prompt_tokens)
         
         if budget_limit and estimated_cost > budget_limit:
             return None
@@ -262,29 +314,29 @@ class CrossProviderIntelligence:
             'score': score,
             'reason': f'intelligent_routing_score_{score:.2f}',
             'performance_data': {
-                'avg_response_time': statistics.mean(performance.get('response_times', [2.0])),
-                'success_rate': statistics.mean(performance.get('success_rate', [0.95])),
-                'avg_quality': statistics.mean(performance.get('quality_scores', [8.0]))
+                'avg_response_time': performance.response_times.mean(2.0),
+                'success_rate': performance.success_rate.mean(0.95),
+                'avg_quality': performance.quality_scores.mean(8.0)
             }
         }
     
     def _calculate_routing_score(self, provider: str, model: str, 
-                               performance: dict, complexity: str, 
+                               performance: ProviderModelMetrics, complexity: str, 
                                estimated_cost: float) -> float:
         """Calculate routing score for provider/model combination"""
         
         score = 10.0  # Base score
         
         # Factor in response time (lower is better)
-        avg_response_time = statistics.mean(performance.get('response_times', [2.0]))
+        avg_response_time = performance.response_times.mean(2.0)
         score -= min(avg_response_time / 2.0, 3.0)  # Max 3 point penalty
         
         # Factor in success rate (higher is better)
-        success_rate = statistics.mean(performance.get('success_rate', [0.95]))
+        success_rate = performance.success_rate.mean(0.95)
         score += (success_rate - 0.5) * 4  # +4 points for perfect success
         
         # Factor in quality (higher is better)
-        avg_quality = statistics.mean(performance.get('quality_scores', [8.0]))
+        avg_quality = performance.quality_scores.mean(8.0)
         score += (avg_quality - 5.0) / 5.0 * 2  # +2 points for quality 10
         
         # Factor in cost (lower is better, but not primary)
@@ -302,31 +354,31 @@ class CrossProviderIntelligence:
         if not options:
             return None
         
-        # Sort by score
-        sorted_options = sorted(options, key=lambda x: x['score'], reverse=True)
-        
         # Apply user preferences
         preference_priorities = preferences.get('priorities', ['quality', 'speed', 'cost'])
         
         if 'cost' in preference_priorities[:2]:
-            # Cost is high priority, prefer cheaper options
-            sorted_options = sorted(sorted_options, key=lambda x: x['estimated_cost'])
+            # Cost is high priority: cheapest option, highest score among equally cheap ones
+            return min(options, key=lambda x: (x['estimated_cost'], -x['score']))
         
-        return sorted_options[0]
+        # Highest score; min() keeps the first of equal scores, as the stable sort did
+        return min(options, key=lambda x: -x['score'])
     
     async def _get_healthy_providers(self, exclude: list = None) -> list:
         """Get list of healthy providers"""
         exclude = exclude or []
         
         healthy_providers = []
+        now = time.monotonic()
         
-        for provider in ['openai', 'anthropic']:
+        for provider in self.providers:
             if provider in exclude:
                 continue
                 
-            status = self.provider_status.get(provider, {'healthy': True, 'last_check': datetime.now()})
+            status = self.provider_status.get(provider, _UNCHECKED_STATUS)
             
-            if status.get('healthy', True):
+            # Unhealthy providers become routable again once their retry window has passed
+            if status.get('healthy', True) or now >= status.get('retry_after_ts', 0.0):
                 healthy_providers.append({
                     'name': provider,
                     'status': status
@@ -336,16 +388,20 @@ class CrossProviderIntelligence:
     
     async def _mark_provider_unhealthy(self, provider: str, reason: str):
         """Mark a provider as temporarily unhealthy"""
+        retry_after_seconds = self.failover_config['retry_after_seconds']
+        marked_at = datetime.now()
         self.provider_status[provider] = {
             'healthy': False,
             'reason': reason,
-            'marked_unhealthy_at': datetime.now(),
-            'retry_after': datetime.now() + timedelta(minutes=5)
+            'marked_unhealthy_at': marked_at,
+            'retry_after': marked_at + timedelta(seconds=retry_after_seconds),
+            'retry_after_ts': time.monotonic() + retry_after_seconds
         }
     
-    async def _update_provider_health(self, provider: str, metrics: dict):
+    async def _update_provider_health(self, provider: str, metrics: ProviderModelMetrics):
         """Update provider health based on recent performance"""
-        recent_success_rate = statistics.mean(metrics['success_rate'][-10:]) if metrics['success_rate'] else 1.0
+        recent = metrics.success_rate.values
+        recent_success_rate = sum(islice(reversed(recent), 10)) / min(len(recent), 10) if recent else 1.0
         
         # Mark as unhealthy if success rate drops below threshold
         if recent_success_rate < self.failover_config['error_rate_threshold']:
@@ -354,33 +410,18 @@ class CrossProviderIntelligence:
             # Mark as healthy
             self.provider_status[provider] = {
                 'healthy': True,
-                'last_check': datetime.now(),
+                'last_check': metrics.last_updated,
                 'success_rate': recent_success_rate
             }
     
-    def _estimate_cost(self, provider: str, model: str, request_data: dict) -> float:
+    def _estimate_cost(self, provider: str, model: str, request_data: dict, prompt_tokens: int) -> float:
         """Estimate cost for request"""
         # This is a simplified estimation - you'd want more sophisticated logic
+        cost_per_token = _COST_PER_TOKEN.get((provider, model), _DEFAULT_COST_PER_TOKEN)
         
-        pricing = {
-            'openai': {
-                'gpt-4': 0.03,
-                'gpt-3.5-turbo': 0.002
-            },
-            'anthropic': {
-                'claude-3-sonnet': 0.015,
-                'claude-3-haiku': 0.00125
-            }
-        }
-        
-        base_cost = pricing.get(provider, {}).get(model, 0.002)
-        
-        # Estimate tokens
-        messages = request_data.get('messages', [])
-        estimated_tokens = sum(len(str(msg.get('content', ''))) for msg in messages) // 4
         max_tokens = request_data.get('max_tokens', 100)
         
-        return (estimated_tokens + max_tokens) / 1000 * base_cost
+        return (prompt_tokens + max_tokens) * cost_per_token
 
 # Create singleton instance
 cross_provider_intelligence = CrossProviderIntelligence()
\ No newline at end of file
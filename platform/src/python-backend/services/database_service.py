@@ -1,12 +1,22 @@
 # services/database_service.py
 import os
+import asyncio
+import httpx
 from supabase import create_client, Client
 from typing import Optional, Dict, Any, List
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Queued after the last request log to tell the flusher to finish and exit
+_STOP_LOGGING = object()
+
 class DatabaseService:
+    # AI request logs are written off the request path in batches
+    LOG_QUEUE_SIZE = 10_000
+    LOG_BATCH_SIZE = 500
+    LOG_BATCH_WINDOW_SECONDS = 1.0
+    
     def __init__(self):
         url = os.getenv("SUPABASE_URL")
         key = os.getenv("SUPABASE_SERVICE_KEY")
@@ -18,6 +28,64 @@ class DatabaseService:
             self.supabase: Client = create_client(url, key)
         except Exception as e:
             raise ConnectionError(f"Failed to connect to Supabase: {e}")
+        
+        # The async methods talk to PostgREST directly so they never block the event loop
+        self._rest_url = f"{url.rstrip('/')}/rest/v1"
+        self._rest_headers = {"apikey": key, "Authorization": f"Bearer {key}"}
+        self._client: Optional[httpx.AsyncClient] = None
+        
+        # ai_request_logs rows awaiting a bulk insert; the flusher task is started on
+        # first use because the singleton is built outside any event loop
+        self._log_queue: asyncio.Queue = asyncio.Queue(maxsize=self.LOG_QUEUE_SIZE)
+        self._log_task: Optional[asyncio.Task] = None
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Pooled PostgREST client, created on first use"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self._rest_url,
+                headers=self._rest_headers,
+                timeout=30.0,
+                limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Flush pending request logs and close pooled PostgREST connections on shutdown"""
+        if self._log_task is not None:
+            # Let the flusher finish the batch it holds and everything queued before the sentinel
+            if not self._log_task.done():
+                await self._log_queue.put(_STOP_LOGGING)
+                await self._log_task
+            self._log_task = None
+        # Anything the flusher did not reach (it had died, or logs arrived after the sentinel)
+        pending = []
+        while not self._log_queue.empty():
+            pending.append(self._log_queue.get_nowait())
+        if pending:
+            await self._flush_request_logs(pending)
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    async def _insert(self, table: str, rows: Any) -> None:
+        """Insert one row or a list of rows, raising on an error response"""
+        params = None
+        headers = {"Prefer": "return=minimal"}
+        if isinstance(rows, list):
+            # Bulk inserts name every column used in the batch; rows without one get its default
+            params = {"columns": ",".join(dict.fromkeys(key for row in rows for key in row))}
+            headers = {"Prefer": "return=minimal,missing=default"}
+        response = await self.client.post(f"/{table}", json=rows, params=params, headers=headers)
+        response.raise_for_status()
+    
+    async def _count(self, table: str) -> int:
+        """Exact row count of a table, read from PostgREST's Content-Range header"""
+        response = await self.client.head(f"/{table}", params={"select": "id"}, headers={"Prefer": "count=exact"})
+        response.raise_for_status()
+        total = response.headers.get("content-range", "").rpartition("/")[2]
+        return int(total) if total.isdigit() else 0
     
     def create_agent(self, name: str, lambda_function_name: str, user_id: str = None) -> Dict[str, Any]:
         """Create a new agent record in database"""
@@ -141,13 +209,46 @@ class DatabaseService:
             print(f"Database error getting MCP servers: {str(e)}")
 
     async def log_ai_request(self, log_entry: Dict[str, Any]) -> bool:
-        """Log AI API request to database"""
+        """Queue an AI API request log for the next batch insert, returning False if the queue is full"""
+        if self._log_task is None or self._log_task.done():
+            self._log_task = asyncio.create_task(self._log_flusher())
         try:
-            response = self.supabase.table('ai_request_logs').insert(log_entry).execute()
-            return response.data is not None
-        except Exception as e:
-            print(f"Error logging AI request: {str(e)}")
+            self._log_queue.put_nowait(log_entry)
+            return True
+        except asyncio.QueueFull:
+            print("Error logging AI request: log queue is full")
             return False
+    
+    async def _log_flusher(self):
+        """Drain the log queue in batches of LOG_BATCH_SIZE or LOG_BATCH_WINDOW_SECONDS until stopped"""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            entry = await self._log_queue.get()
+            if entry is _STOP_LOGGING:
+                return
+            batch = [entry]
+            deadline = loop.time() + self.LOG_BATCH_WINDOW_SECONDS
+            while len(batch) < self.LOG_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    entry = await asyncio.wait_for(self._log_queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if entry is _STOP_LOGGING:
+                    stopping = True
+                    break
+                batch.append(entry)
+            await self._flush_request_logs(batch)
+    
+    async def _flush_request_logs(self, batch: List[Dict[str, Any]]):
+        """Insert a batch of request logs, never letting a failure stop the flusher"""
+        try:
+            await self._insert('ai_request_logs', batch)
+        except Exception as e:
+            print(f"Error logging {len(batch)} AI requests: {str(e)}")
 
     async def log_quality_analysis(self, quality_analysis: Dict[str, Any]) -> bool:
         """Log AI quality analysis to database"""
@@ -182,8 +283,8 @@ class DatabaseService:
                 'alerts': quality_analysis.get('alerts', [])
             }
             
-            response = self.supabase.table('ai_quality_analysis').insert(analysis_data).execute()
-            return response.data is not None
+            await self._insert('ai_quality_analysis', analysis_data)
+            return True
         except Exception as e:
             print(f"Error logging quality analysis: {str(e)}")
             return False
@@ -221,8 +322,8 @@ class DatabaseService:
                 'alerts': []
             }
             
-            response = self.supabase.table('ai_quality_analysis').insert(analysis_data).execute()
-            return response.data is not None
+            await self._insert('ai_quality_analysis', analysis_data)
+            return True
         except Exception as e:
             print(f"Error storing quality analysis: {str(e)}")
             return False
@@ -517,8 +618,7 @@ class DatabaseService:
     async def get_agent_count(self) -> int:
         """Get total number of agents"""
         try:
-            response = self.supabase.table('agents').select('id', count='exact').execute()
-            return response.count if response.count else 0
+            return await self._count('agents')
         except Exception as e:
             print(f"Error getting agent count: {str(e)}")
             return 0
@@ -526,8 +626,7 @@ class DatabaseService:
     async def get_total_request_count(self) -> int:
         """Get total number of requests"""
         try:
-            response = self.supabase.table('ai_request_logs').select('id', count='exact').execute()
-            return response.count if response.count else 0
+            return await self._count('ai_request_logs')
         except Exception as e:
             print(f"Error getting total request count: {str(e)}")
             return 0
@@ -535,8 +634,13 @@ class DatabaseService:
     async def get_recent_requests(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Get recent requests"""
         try:
-            response = self.supabase.table('ai_request_logs').select('*').order('created_at', desc=True).limit(limit).execute()
-            return response.data if response.data else []
+            response = await self.client.get('/ai_request_logs', params={
+                'select': '*',
+                'order': 'created_at.desc',
+                'limit': limit
+            })
+            response.raise_for_status()
+            return response.json() or []
         except Exception as e:
             print(f"Error getting recent requests: {str(e)}")
             return []
@@ -97,6 +97,11 @@ class TrafficAnalyzer:
         
         logger.info(f"Logged traffic: {traffic_request.request_id}")
     
+    async def log_traffic_batch(self, records: List[tuple]):
+        """Log a batch of (traffic_request, traffic_response) pairs"""
+        for traffic_request, traffic_response in records:
+            await self.log_traffic(traffic_request, traffic_response)
+    
     async def _update_counters(self, traffic_request, traffic_response):
         """Update real-time counters"""
         self.counters["total_requests"] += 1
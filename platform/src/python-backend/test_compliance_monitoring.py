@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Regression tests for compliance assessment results
+Mutating one returned assessment must never leak into later assessments
+"""
+
+import asyncio
+
+from services.compliance_native_monitoring import ComplianceNativeMonitor, ComplianceFramework
+
+def _tamper(result):
+    """Overwrite every evidence record of an assessment result"""
+    for record in result["evidence"]:
+        record["status"] = "TAMPERED"
+
+def test_evidence_not_shared_across_assessments():
+    """Tampering with one result's evidence leaves other assessments untouched"""
+    monitor = ComplianceNativeMonitor()
+    for framework in (ComplianceFramework.GDPR, ComplianceFramework.NIST_AI_RMF):
+        first = asyncio.run(monitor.assess_compliance(framework, {"lawful_basis": "Consent"}))
+        _tamper(first)
+        # Different data shares the non-compliant evidence records; the same data hits the cache
+        for data in ({"privacy_notice": True}, {"lawful_basis": "Consent"}):
+            later = asyncio.run(monitor.assess_compliance(framework, data))
+            assert later["evidence"], framework
+            assert all(record["status"] != "TAMPERED" for record in later["evidence"]), framework
+
+def test_cleared_cache_reassesses():
+    """clear_assessment_cache() drops cached assessor results"""
+    monitor = ComplianceNativeMonitor()
+    asyncio.run(monitor.assess_compliance(ComplianceFramework.GDPR, {"lawful_basis": "Consent"}))
+    assert len(monitor._assessment_cache) == 1
+    monitor.clear_assessment_cache()
+    assert len(monitor._assessment_cache) == 0
+
+def test_oversized_integers_are_assessed():
+    """Integers beyond 64 bits are assessed instead of failing the content hash"""
+    monitor = ComplianceNativeMonitor()
+    result = asyncio.run(monitor.assess_compliance(ComplianceFramework.GDPR, {"lawful_basis": 2 ** 70}))
+    assert result["status"] != "failed"
+    assert result["compliance_score"] == 0.25
+
+def test_non_finite_floats_do_not_share_cache_entries():
+    """NaN and Infinity are cached apart from null"""
+    monitor = ComplianceNativeMonitor()
+    for value in (float("nan"), float("inf"), float("-inf")):
+        asyncio.run(monitor.assess_compliance(ComplianceFramework.GDPR, {"lawful_basis": value}))
+        result = asyncio.run(monitor.assess_compliance(ComplianceFramework.GDPR, {"lawful_basis": None}))
+        assert result["compliance_score"] == 0.0, value
+
+if __name__ == "__main__":
+    for test in (test_evidence_not_shared_across_assessments, test_cleared_cache_reassesses,
+                 test_oversized_integers_are_assessed, test_non_finite_floats_do_not_share_cache_entries):
+        test()
+        print(f"✓ {test.__doc__}")
@@ -0,0 +1,21 @@
+# utils/timestamps.py
+import time
+from typing import Callable
+
+def _second_cached_isoformat(to_struct_time: Callable[[int], time.struct_time]) -> Callable[[float], str]:
+    """ISO formatter for POSIX timestamps that formats the date part at most once per second"""
+    # (epoch second, ISO-formatted prefix) of the last timestamp formatted
+    cache = (None, "")
+
+    def isoformat(timestamp: float) -> str:
+        nonlocal cache
+        second = int(timestamp)
+        if second != cache[0]:
+            cache = (second, time.strftime("%Y-%m-%dT%H:%M:%S", to_struct_time(second)))
+        return f"{cache[1]}.{int((timestamp - second) * 1_000_000):06d}"
+
+    return isoformat
+
+# Microseconds are truncated rather than rounded
+utc_isoformat = _second_cached_isoformat(time.gmtime)
+local_isoformat = _second_cached_isoformat(time.localtime)
@@ -43,14 +43,14 @@ async def verify_compliance():
     
     try:
         # Verify EU AI Act
-        eu_result = await monitor._assess_eu_ai_act_compliance(ai_system_data)
+        eu_result = monitor._assess_eu_ai_act_compliance(ai_system_data)
         if eu_result['status'] == 'compliant':
             print("✅ EU AI Act assessment logic verified (Compliant).")
         else:
             print(f"⚠️ EU AI Act assessment returned: {eu_result['status']}")
             
         # Verify GDPR
-        gdpr_result = await monitor._assess_gdpr_compliance(ai_system_data)
+        gdpr_result = monitor._assess_gdpr_compliance(ai_system_data)
         if gdpr_result['status'] == 'compliant':
             print("✅ GDPR assessment logic verified (Compliant).")
         else: